@@ -4,69 +4,154 @@ Génère visualisations et analyses pour le rapport et la soutenance.
 """
 
 import sys
-import io
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Rendu sans affichage, sûr dans les processus workers
+matplotlib.rcParams.update({
+    'text.usetex': False,             # Pas d'appel à LaTeX
+    'path.simplify': True,            # Simplification des tracés avant rastérisation
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,      # Limite la mémoire pour les grands nuages de points
+})
 import matplotlib.pyplot as plt
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
 import seaborn as sns
 from pathlib import Path
 import json
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration du style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 10
 
-# Chemins - Auto-détection du dernier résultat
+# Chemins (le dernier résultat est détecté dans main)
 RESULTS_DIR = Path("results")
 METRICS_DIR = RESULTS_DIR / "metrics"
-
-# Trouver le dernier fichier de métriques
-metric_files = sorted(METRICS_DIR.glob("metrics_*.json"))
-if not metric_files:
-    print("❌ Aucun fichier de métriques trouvé!")
-    exit(1)
-
-METRICS_FILE = metric_files[-1]
-timestamp = METRICS_FILE.stem.replace("metrics_", "")
-PARETO_FILE = RESULTS_DIR / f"pareto_front_{timestamp}.csv"
-RESULT_FILE = RESULTS_DIR / f"result_{timestamp}.json"
-
 OUTPUT_DIR = Path("analysis_output")
-OUTPUT_DIR.mkdir(exist_ok=True)
 
-print(f"📊 Analyse des résultats du {timestamp}")
-print(f"   Métriques: {METRICS_FILE}")
-print(f"   Pareto: {PARETO_FILE}")
-print()
+# Colonnes des objectifs, dans l'ordre de la matrice F (n, 3)
+OBJECTIVES = ['cost', 'dissatisfaction', 'peak_power']
+
+# Au-delà de ces tailles de front, les projections 2D passent en points
+# rastérisés sans contour, puis en hexbin (coût O(N), sans tracé par point)
+LARGE_FRONT_SIZE = 1000
+HEXBIN_FRONT_SIZE = 20000
+
+def use_utf8_stdout():
+    """Sortie console en UTF-8 (emojis), aussi appelée dans chaque processus worker."""
+    sys.stdout.reconfigure(encoding='utf-8')
+
+def find_latest_results():
+    """
+    Chemins du dernier résultat (métriques, front de Pareto, résumé JSON).
+
+    Returns:
+        (timestamp, metrics_file, pareto_file, result_file), ou None si
+        aucun fichier de métriques n'existe
+    """
+    metric_files = sorted(METRICS_DIR.glob("metrics_*.json"))
+    if not metric_files:
+        return None
+
+    metrics_file = metric_files[-1]
+    timestamp = metrics_file.stem.replace("metrics_", "")
+    return (
+        timestamp,
+        metrics_file,
+        RESULTS_DIR / f"pareto_front_{timestamp}.csv",
+        RESULTS_DIR / f"result_{timestamp}.json",
+    )
 
-def load_data():
+def load_data(metrics_file, pareto_file, result_file):
     """Charge les données de métriques et du front de Pareto."""
-    with open(METRICS_FILE, 'r') as f:
+    with open(metrics_file, 'r') as f:
         metrics = json.load(f)
 
-    pareto_df = pd.read_csv(PARETO_FILE)
+    # Colonnes typées dès la lecture (float32 suffit pour les graphiques) :
+    # pas d'inférence de type ni de conversion après coup.
+    # Parseur PyArrow (multi-thread) si disponible, sinon parseur C
+    dtypes = {col: 'float32' for col in OBJECTIVES}
+    try:
+        pareto_df = pd.read_csv(pareto_file, dtype=dtypes, engine='pyarrow')
+    except ImportError:
+        pareto_df = pd.read_csv(pareto_file, dtype=dtypes, engine='c')
 
-    with open(RESULT_FILE, 'r') as f:
+    with open(result_file, 'r') as f:
         result = json.load(f)
 
     return metrics, pareto_df, result
 
-def plot_pareto_3d(pareto_df, metrics):
+def objectives_matrix(pareto_df):
+    """Matrice contiguë (n, 3) float32 des objectifs, colonnes dans l'ordre d'OBJECTIVES."""
+    return np.ascontiguousarray(pareto_df[OBJECTIVES].to_numpy(dtype=np.float32))
+
+def objective_stats(metrics):
+    """
+    Tableau (objectif x best/worst/mean/std/cv) construit depuis les métriques.
+
+    Le coefficient de variation est calculé en une passe via DataFrame.eval
+    (0 quand la moyenne est nulle).
+    """
+    stats = pd.DataFrame({
+        'best': metrics['best_objectives'],
+        'worst': metrics['worst_objectives'],
+        'mean': metrics['mean_objectives'],
+        'std': metrics['std_objectives'],
+    }).reindex(OBJECTIVES)
+    stats = stats.eval('cv = std / abs(mean) * 100')
+    stats['cv'] = stats['cv'].replace([np.inf, -np.inf], np.nan).fillna(0.0)
+    return stats
+
+def colorize(values, cmap):
+    """
+    Couleurs RGBA calculées une seule fois pour une colonne d'objectif.
+
+    Returns:
+        (rgba, mappable) : couleurs à passer en ``c=`` et ScalarMappable
+        partageant la même normalisation (pour une éventuelle colorbar).
+    """
+    mappable = ScalarMappable(norm=Normalize(values.min(), values.max()), cmap=cmap)
+    return mappable.to_rgba(values), mappable
+
+def scatter_projection(ax, x, y, values, cmap):
+    """
+    Nuage de points d'une projection 2D, couleur = troisième objectif.
+
+    Les petits fronts gardent des points cerclés de noir ; au-delà de
+    LARGE_FRONT_SIZE les points sont petits, sans contour et rastérisés,
+    au-delà de HEXBIN_FRONT_SIZE un hexbin affiche la moyenne de ``values``
+    par cellule.
+    """
+    n = len(x)
+    if n > HEXBIN_FRONT_SIZE:
+        return ax.hexbin(x, y, C=values, reduce_C_function=np.mean, gridsize=60, cmap=cmap)
+
+    rgba, _ = colorize(values, cmap)
+    if n > LARGE_FRONT_SIZE:
+        return ax.scatter(x, y, c=rgba, s=8, alpha=0.4, edgecolors='none', rasterized=True)
+    return ax.scatter(x, y, c=rgba, s=80, alpha=0.7, edgecolors='black', linewidth=0.5)
+
+def find_remarkable_solutions(F):
+    """Indices des solutions remarquables (minimum de chaque objectif) en une seule réduction."""
+    return F.argmin(axis=0)
+
+def plot_pareto_3d(F, metrics, output_dir):
     """Visualisation 3D du front de Pareto."""
     fig = plt.figure(figsize=(14, 10))
     ax = fig.add_subplot(111, projection='3d')
 
     # Scatter plot
-    scatter = ax.scatter(
-        pareto_df['cost'],
-        pareto_df['dissatisfaction'],
-        pareto_df['peak_power'],
-        c=pareto_df['cost'],
-        cmap='RdYlGn_r',
+    rgba_cost, cost_mappable = colorize(F[:, 0], 'RdYlGn_r')
+    ax.scatter(
+        F[:, 0],
+        F[:, 1],
+        F[:, 2],
+        c=rgba_cost,
         s=100,
         alpha=0.6,
         edgecolors='black',
@@ -74,20 +159,16 @@ def plot_pareto_3d(pareto_df, metrics):
     )
 
     # Solutions remarquables
-    profit_max = pareto_df.loc[pareto_df['cost'].idxmin()]
-    ax.scatter([profit_max['cost']], [profit_max['dissatisfaction']],
-               [profit_max['peak_power']], c='gold', s=400, marker='*',
-               edgecolors='black', linewidth=2, label='Profit Max', zorder=10)
-
-    peak_min = pareto_df.loc[pareto_df['peak_power'].idxmin()]
-    ax.scatter([peak_min['cost']], [peak_min['dissatisfaction']],
-               [peak_min['peak_power']], c='blue', s=400, marker='s',
-               edgecolors='black', linewidth=2, label='Pic Min', zorder=10)
-
-    dissatis_min = pareto_df.loc[pareto_df['dissatisfaction'].idxmin()]
-    ax.scatter([dissatis_min['cost']], [dissatis_min['dissatisfaction']],
-               [dissatis_min['peak_power']], c='green', s=400, marker='^',
-               edgecolors='black', linewidth=2, label='Satisfaction Max', zorder=10)
+    idx_min = find_remarkable_solutions(F)
+    remarkable = [
+        (idx_min[0], 'gold', '*', 'Profit Max'),
+        (idx_min[2], 'blue', 's', 'Pic Min'),
+        (idx_min[1], 'green', '^', 'Satisfaction Max'),
+    ]
+    for idx, color, marker, label in remarkable:
+        cost, dissatisfaction, peak = F[idx]
+        ax.scatter([cost], [dissatisfaction], [peak], c=color, s=400, marker=marker,
+                   edgecolors='black', linewidth=2, label=label, zorder=10)
 
     # Labels
     ax.set_xlabel('Coût (€)', fontsize=12, fontweight='bold')
@@ -97,31 +178,29 @@ def plot_pareto_3d(pareto_df, metrics):
                  f'HV = {metrics["hypervolume"]:.4f} | SP = {metrics["spacing"]:.4f}',
                  fontsize=14, fontweight='bold', pad=20)
 
-    cbar = plt.colorbar(scatter, ax=ax, pad=0.1, shrink=0.8)
+    cbar = plt.colorbar(cost_mappable, ax=ax, pad=0.1, shrink=0.8)
     cbar.set_label('Coût (€)', fontsize=11, fontweight='bold')
 
     ax.legend(loc='upper left', fontsize=10, framealpha=0.9)
 
     plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'pareto_3d.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'pareto_3d.png', dpi=300, bbox_inches='tight')
     print("✓ Graphique 3D sauvegardé : pareto_3d.png")
     plt.close()
 
-def plot_pareto_2d_projections(pareto_df, metrics):
+def plot_pareto_2d_projections(F, metrics, output_dir):
     """Projections 2D du front de Pareto."""
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
 
     # Coût vs Insatisfaction
-    axes[0, 0].scatter(pareto_df['cost'], pareto_df['dissatisfaction'],
-                       c=pareto_df['peak_power'], cmap='viridis', s=80, alpha=0.7, edgecolors='black', linewidth=0.5)
+    scatter_projection(axes[0, 0], F[:, 0], F[:, 1], F[:, 2], 'viridis')
     axes[0, 0].set_xlabel('Coût (€)', fontsize=11, fontweight='bold')
     axes[0, 0].set_ylabel('Insatisfaction', fontsize=11, fontweight='bold')
     axes[0, 0].set_title('Coût vs Insatisfaction\n(couleur = Pic de puissance)', fontsize=12, fontweight='bold')
     axes[0, 0].grid(True, alpha=0.3)
 
     # Coût vs Pic
-    axes[0, 1].scatter(pareto_df['cost'], pareto_df['peak_power'],
-                       c=pareto_df['dissatisfaction'], cmap='coolwarm', s=80, alpha=0.7, edgecolors='black', linewidth=0.5)
+    scatter_projection(axes[0, 1], F[:, 0], F[:, 2], F[:, 1], 'coolwarm')
     axes[0, 1].set_xlabel('Coût (€)', fontsize=11, fontweight='bold')
     axes[0, 1].set_ylabel('Pic de Puissance (kW)', fontsize=11, fontweight='bold')
     axes[0, 1].set_title('Coût vs Pic de Puissance\n(couleur = Insatisfaction)', fontsize=12, fontweight='bold')
@@ -130,15 +209,14 @@ def plot_pareto_2d_projections(pareto_df, metrics):
     axes[0, 1].grid(True, alpha=0.3)
 
     # Insatisfaction vs Pic
-    axes[1, 0].scatter(pareto_df['dissatisfaction'], pareto_df['peak_power'],
-                       c=pareto_df['cost'], cmap='RdYlGn_r', s=80, alpha=0.7, edgecolors='black', linewidth=0.5)
+    scatter_projection(axes[1, 0], F[:, 1], F[:, 2], F[:, 0], 'RdYlGn_r')
     axes[1, 0].set_xlabel('Insatisfaction', fontsize=11, fontweight='bold')
     axes[1, 0].set_ylabel('Pic de Puissance (kW)', fontsize=11, fontweight='bold')
     axes[1, 0].set_title('Insatisfaction vs Pic de Puissance\n(couleur = Coût)', fontsize=12, fontweight='bold')
     axes[1, 0].grid(True, alpha=0.3)
 
     # Distributions
-    axes[1, 1].hist(pareto_df['cost'], bins=20, alpha=0.6, label='Coût', color='blue', edgecolor='black')
+    axes[1, 1].hist(F[:, 0], bins=20, alpha=0.6, label='Coût', color='blue', edgecolor='black')
     axes[1, 1].axvline(metrics['best_objectives']['cost'], color='blue', linestyle='--', linewidth=2, label=f"Min: {metrics['best_objectives']['cost']:.2f}€")
     axes[1, 1].axvline(metrics['mean_objectives']['cost'], color='darkblue', linestyle='-', linewidth=2, label=f"Moy: {metrics['mean_objectives']['cost']:.2f}€")
     axes[1, 1].set_xlabel('Coût (€)', fontsize=11, fontweight='bold')
@@ -150,13 +228,14 @@ def plot_pareto_2d_projections(pareto_df, metrics):
     plt.suptitle(f'Projections 2D du Front de Pareto\nHV = {metrics["hypervolume"]:.4f} | SP = {metrics["spacing"]:.4f}',
                  fontsize=15, fontweight='bold', y=0.995)
     plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'pareto_2d_projections.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'pareto_2d_projections.png', dpi=300, bbox_inches='tight')
     print("✓ Projections 2D sauvegardées : pareto_2d_projections.png")
     plt.close()
 
-def plot_objectives_analysis(pareto_df, metrics):
+def plot_objectives_analysis(F, metrics, output_dir):
     """Analyse statistique des objectifs."""
     fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+    stats = objective_stats(metrics)
 
     objectives = {
         'cost': ('Coût (€)', 'blue'),
@@ -169,17 +248,13 @@ def plot_objectives_analysis(pareto_df, metrics):
         col = idx % 3
 
         # Boxplot
-        bp = axes[row, col].boxplot([pareto_df[obj]], vert=True, patch_artist=True,
+        bp = axes[row, col].boxplot([F[:, idx]], vert=True, patch_artist=True,
                                      widths=0.5, showmeans=True,
                                      meanprops=dict(marker='D', markerfacecolor='red', markersize=8))
         bp['boxes'][0].set_facecolor(color)
         bp['boxes'][0].set_alpha(0.6)
 
-        best = metrics['best_objectives'][obj]
-        worst = metrics['worst_objectives'][obj]
-        mean = metrics['mean_objectives'][obj]
-        std = metrics['std_objectives'][obj]
-        cv = (std / abs(mean)) * 100 if mean != 0 else 0
+        best, worst, mean, cv = stats.loc[obj, ['best', 'worst', 'mean', 'cv']]
 
         axes[row, col].text(1.3, best, f'Min: {best:.2f}', fontsize=9, va='center', fontweight='bold')
         axes[row, col].text(1.3, worst, f'Max: {worst:.2f}', fontsize=9, va='center', fontweight='bold')
@@ -195,7 +270,7 @@ def plot_objectives_analysis(pareto_df, metrics):
         row = 1
         col = idx
 
-        axes[row, col].hist(pareto_df[obj], bins=25, alpha=0.7, color=color, edgecolor='black')
+        axes[row, col].hist(F[:, idx], bins=25, alpha=0.7, color=color, edgecolor='black')
         axes[row, col].axvline(metrics['best_objectives'][obj], color='darkgreen',
                                linestyle='--', linewidth=2, label='Min')
         axes[row, col].axvline(metrics['mean_objectives'][obj], color='red',
@@ -210,11 +285,11 @@ def plot_objectives_analysis(pareto_df, metrics):
 
     plt.suptitle('Analyse Statistique des Objectifs', fontsize=15, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'objectives_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'objectives_analysis.png', dpi=300, bbox_inches='tight')
     print("✓ Analyse des objectifs sauvegardée : objectives_analysis.png")
     plt.close()
 
-def plot_metrics_comparison(metrics):
+def plot_metrics_comparison(metrics, output_dir):
     """Visualisation des métriques de performance."""
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
@@ -250,32 +325,33 @@ def plot_metrics_comparison(metrics):
 
     plt.suptitle('Métriques de Performance Multi-Objectifs', fontsize=15, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'metrics_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'metrics_comparison.png', dpi=300, bbox_inches='tight')
     print("✓ Comparaison des métriques sauvegardée : metrics_comparison.png")
     plt.close()
 
-def plot_remarkable_solutions(pareto_df, metrics):
+def plot_remarkable_solutions(F, metrics, output_dir):
     """Visualisation des solutions remarquables."""
     fig, ax = plt.subplots(figsize=(14, 8))
 
     # Toutes les solutions
-    ax.scatter(pareto_df['cost'], pareto_df['peak_power'],
+    ax.scatter(F[:, 0], F[:, 2],
                c='lightgray', s=100, alpha=0.5, edgecolors='gray', linewidth=0.5, label='Toutes les solutions')
 
-    # Solutions remarquables
-    solutions = [
-        (pareto_df.loc[pareto_df['cost'].idxmin()], 'gold', '*', 'Profit Max', 500),
-        (pareto_df.loc[pareto_df['peak_power'].idxmin()], 'blue', 's', 'Pic Min', 400),
-        (pareto_df.loc[pareto_df['dissatisfaction'].idxmin()], 'green', '^', 'Satisfaction Max', 400),
+    # Solutions remarquables : une seule extraction NumPy des trois minima
+    # (ordre : coût, pic, insatisfaction)
+    idx_min = find_remarkable_solutions(F)
+    rows = F[idx_min[[0, 2, 1]]]
+    styles = [
+        ('gold', '*', 'Profit Max', 500),
+        ('blue', 's', 'Pic Min', 400),
+        ('green', '^', 'Satisfaction Max', 400),
     ]
 
-    for sol, color, marker, label, size in solutions:
-        ax.scatter([sol['cost']], [sol['peak_power']],
-                   c=color, s=size, marker=marker, edgecolors='black',
+    for (cost, dissatisfaction, peak), (color, marker, label, size) in zip(rows.tolist(), styles):
+        ax.scatter([cost], [peak], c=color, s=size, marker=marker, edgecolors='black',
                    linewidth=2, label=label, zorder=10, alpha=0.9)
-
-        ax.annotate(f"{label}\nCoût: {sol['cost']:.2f}€\nInsatis: {sol['dissatisfaction']:.2f}\nPic: {sol['peak_power']:.2f}kW",
-                    xy=(sol['cost'], sol['peak_power']),
+        ax.annotate(f"{label}\nCoût: {cost:.2f}€\nInsatis: {dissatisfaction:.2f}\nPic: {peak:.2f}kW",
+                    xy=(cost, peak),
                     xytext=(20, 20), textcoords='offset points',
                     bbox=dict(boxstyle='round,pad=0.5', fc=color, alpha=0.7),
                     arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3', lw=2),
@@ -293,12 +369,13 @@ def plot_remarkable_solutions(pareto_df, metrics):
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'remarkable_solutions.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'remarkable_solutions.png', dpi=300, bbox_inches='tight')
     print("✓ Solutions remarquables sauvegardées : remarkable_solutions.png")
     plt.close()
 
-def generate_summary_table(pareto_df, metrics):
+def generate_summary_table(pareto_df, metrics, output_dir):
     """Génère un tableau récapitulatif."""
+    cv = objective_stats(metrics)['cv']
     summary = f"""
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                    RÉSUMÉ DES MÉTRIQUES DE PERFORMANCE               ║
@@ -330,9 +407,9 @@ def generate_summary_table(pareto_df, metrics):
 └──────────────────────────────────────────────────────────────────────┘
 
 ┌─ COEFFICIENTS DE VARIATION ──────────────────────────────────────────┐
-│ CV Coût:                    {(metrics['std_objectives']['cost'] / abs(metrics['mean_objectives']['cost']) * 100):>10.1f} %                    │
-│ CV Insatisfaction:          {(metrics['std_objectives']['dissatisfaction'] / metrics['mean_objectives']['dissatisfaction'] * 100):>10.1f} %                    │
-│ CV Pic de puissance:        {(metrics['std_objectives']['peak_power'] / metrics['mean_objectives']['peak_power'] * 100):>10.1f} %                    │
+│ CV Coût:                    {cv['cost']:>10.1f} %                    │
+│ CV Insatisfaction:          {cv['dissatisfaction']:>10.1f} %                    │
+│ CV Pic de puissance:        {cv['peak_power']:>10.1f} %                    │
 └──────────────────────────────────────────────────────────────────────┘
 
 ┌─ INTERPRÉTATION ─────────────────────────────────────────────────────┐
@@ -345,36 +422,71 @@ def generate_summary_table(pareto_df, metrics):
 └──────────────────────────────────────────────────────────────────────┘
 """
 
-    with open(OUTPUT_DIR / 'summary_table.txt', 'w', encoding='utf-8') as f:
-        f.write(summary)
+    (output_dir / 'summary_table.txt').write_text(summary, encoding='utf-8')
 
     print(summary)
     print("✓ Tableau récapitulatif sauvegardé : summary_table.txt")
 
+def _run_plot(task):
+    """Exécute une fonction de tracé dans un processus worker."""
+    plot_fn, args = task
+    plot_fn(*args)
+
+def generate_plots(F, metrics, output_dir):
+    """
+    Génère les cinq figures en parallèle.
+
+    Les figures sont indépendantes et l'encodage PNG (dpi=300) est coûteux
+    en CPU : le temps total devient celui de la figure la plus lente.
+    Les workers reçoivent toutes leurs données en argument : avec la
+    méthode spawn (Windows, macOS) ils ne réimportent que des définitions.
+    """
+    tasks = [
+        (plot_pareto_3d, (F, metrics, output_dir)),
+        (plot_pareto_2d_projections, (F, metrics, output_dir)),
+        (plot_objectives_analysis, (F, metrics, output_dir)),
+        (plot_metrics_comparison, (metrics, output_dir)),
+        (plot_remarkable_solutions, (F, metrics, output_dir)),
+    ]
+    with ProcessPoolExecutor(max_workers=len(tasks), initializer=use_utf8_stdout) as executor:
+        list(executor.map(_run_plot, tasks))
+
 def main():
     """Fonction principale."""
+    use_utf8_stdout()
+
+    # Auto-détection du dernier résultat
+    latest = find_latest_results()
+    if latest is None:
+        print("❌ Aucun fichier de métriques trouvé!")
+        sys.exit(1)
+    timestamp, metrics_file, pareto_file, result_file = latest
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    print(f"📊 Analyse des résultats du {timestamp}")
+    print(f"   Métriques: {metrics_file}")
+    print(f"   Pareto: {pareto_file}")
+    print()
+
     print("\n" + "="*70)
     print("  ANALYSE DES MÉTRIQUES D'OPTIMISATION MULTI-OBJECTIFS")
     print("="*70 + "\n")
 
     # Chargement
     print("📊 Chargement des données...")
-    metrics, pareto_df, result = load_data()
+    metrics, pareto_df, result = load_data(metrics_file, pareto_file, result_file)
     print(f"   ✓ {metrics['n_solutions']} solutions chargées")
     print(f"   ✓ HV = {metrics['hypervolume']:.4f}")
     print(f"   ✓ SP = {metrics['spacing']:.4f}\n")
 
     # Visualisations
     print("📈 Génération des visualisations...\n")
-    plot_pareto_3d(pareto_df, metrics)
-    plot_pareto_2d_projections(pareto_df, metrics)
-    plot_objectives_analysis(pareto_df, metrics)
-    plot_metrics_comparison(metrics)
-    plot_remarkable_solutions(pareto_df, metrics)
+    F = objectives_matrix(pareto_df)
+    generate_plots(F, metrics, OUTPUT_DIR)
 
     # Tableau
     print("\n📋 Génération du tableau récapitulatif...\n")
-    generate_summary_table(pareto_df, metrics)
+    generate_summary_table(pareto_df, metrics, OUTPUT_DIR)
 
     print("\n" + "="*70)
     print(f"  ✓ Analyse terminée ! Fichiers sauvegardés dans : {OUTPUT_DIR}")
@@ -1,20 +1,81 @@
 """
 Optimize charging use case - orchestrates the optimization workflow.
 """
+import hashlib
+from concurrent.futures import Future
+from functools import lru_cache
 from datetime import date, timedelta
-from typing import Optional
+from typing import List, Optional, Sequence
 from pathlib import Path
 
 from ...core.interfaces.optimizer import IOptimizer
 from ...core.interfaces.data_source import IDataSource, ISyntheticDataSource
-from ...core.interfaces.cache import ICache
+from ...core.interfaces.cache import ICache, NEVER_EXPIRE
 from ...core.models.optimization_result import OptimizationResult
 from ...core.entities.scenario import Scenario
+from ...core.models.charging_session import ChargingSession
+from ...core.serialization import dumps_json
 from ...config.logging_config import get_logger
+from ...config.settings import settings
+from ...services.valley_filling_service import ValleyFillingOptimizerService
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _metrics_calculator():
+    """
+    Shared MetricsCalculator for print_summary (None if pymoo is missing).
+    
+    Imported on first use: runs without a Pareto front never load pymoo.
+    """
+    try:
+        from ...services.metrics_calculator import MetricsCalculator
+    except ImportError:
+        return None
+    return MetricsCalculator()
+
+
+# Bump when the cached Scenario layout or the way it is built changes,
+# so that entries written by older versions are never read back
+SCENARIO_CACHE_VERSION = 3
+
+
+def scenario_cache_key(
+    site: str,
+    start_date: date,
+    limit: Optional[int],
+    site_max_power: float
+) -> str:
+    """
+    Content-addressed cache key of a real-data scenario.
+    
+    Fingerprints every input baked into the scenario: the fetch parameters,
+    the site power limit, the battery/power settings used to build the
+    vehicles and SCENARIO_CACHE_VERSION.
+    
+    Args:
+        site: Site identifier
+        start_date: Date of the sessions
+        limit: Vehicle limit (None for all)
+        site_max_power: Site power limit in kW
+        
+    Returns:
+        Cache key (blake2b fingerprint of the scenario inputs)
+    """
+    fingerprint = "|".join(map(str, (
+        SCENARIO_CACHE_VERSION,
+        site,
+        start_date,
+        limit,
+        float(site_max_power),
+        settings.battery_capacity,
+        settings.charging_power_min,
+        settings.charging_power_max
+    ))).encode()
+    return "scenario_" + hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+
+
 class OptimizeChargingUseCase:
     """
     Use case for optimizing EV charging schedules.
@@ -23,25 +84,60 @@ class OptimizeChargingUseCase:
     
     def __init__(
         self,
-        optimizer: IOptimizer,
+        optimizer: Optional[IOptimizer],
         real_data_source: Optional[IDataSource] = None,
         synthetic_data_source: Optional[ISyntheticDataSource] = None,
-        cache: Optional[ICache] = None
+        cache: Optional[ICache] = None,
+        objectives: Optional[Sequence[str]] = None,
+        optimize_pareto: bool = True
     ):
         """
         Initialize use case.
         
         Args:
-            optimizer: Optimization engine
+            optimizer: Multi-objective optimization engine (may be None
+                when optimize_pareto is False)
             real_data_source: Real data repository (Caltech)
             synthetic_data_source: Synthetic data generator
             cache: Cache implementation
+            objectives: Objectives to optimize ('cost', 'peak_power');
+                a single objective selects the valley-filling solver
+                instead of the multi-objective optimizer
+            optimize_pareto: Whether a Pareto front is needed; if False the
+                single-objective solver selected by SINGLE_OBJECTIVE_SOLVER
+                (valley filling or SciPy DE) is used instead of optimizer
         """
+        if objectives is not None and len(objectives) == 1:
+            optimizer = ValleyFillingOptimizerService(
+                self._single_objective_config(objectives[0])
+            )
+        elif not optimize_pareto:
+            if settings.single_objective_solver == "scipy_de":
+                # Imported only when selected (loads SciPy, pymoo and the kernels)
+                from ...services.scipy_de_service import ScipyDEOptimizerService
+                optimizer = ScipyDEOptimizerService()
+            else:
+                optimizer = ValleyFillingOptimizerService()
+        elif optimizer is None:
+            raise ValueError("An optimizer is required when optimize_pareto is True")
         self.optimizer = optimizer
         self.real_data_source = real_data_source
         self.synthetic_data_source = synthetic_data_source
         self.cache = cache
     
+    @staticmethod
+    def _single_objective_config(objective: str) -> dict:
+        """Valley-filling configuration for a single objective."""
+        config = settings.get_valley_filling_config()
+        if objective == 'peak_power':
+            config['price_weight'] = 0.0
+        elif objective == 'cost':
+            # Price dominates the fill level, load only breaks ties
+            config['price_weight'] = 1e6
+        else:
+            raise ValueError(f"Unsupported single objective: {objective}")
+        return config
+    
     def execute_real_data(
         self,
         start_date: date,
@@ -49,7 +145,9 @@ class OptimizeChargingUseCase:
         site_max_power: float = 60.0,
         limit: Optional[int] = None,
         save_results: bool = True,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        prefetched_sessions: Optional[List[ChargingSession]] = None,
+        sessions_future: Optional[Future] = None
     ) -> OptimizationResult:
         """
         Execute optimization with real Caltech data.
@@ -61,6 +159,10 @@ class OptimizeChargingUseCase:
             limit: Limit number of vehicles
             save_results: Whether to save results to files
             output_dir: Directory for output files
+            prefetched_sessions: All sessions of start_date, already fetched
+                (e.g. by the interactive menu); skips the API call
+            sessions_future: Background fetch of all sessions of start_date,
+                only waited for on a cache miss
             
         Returns:
             Optimization result
@@ -71,7 +173,7 @@ class OptimizeChargingUseCase:
         logger.info(f"Executing optimization with real data: {site} - {start_date}")
         
         # Check cache
-        cache_key = f"scenario_{site}_{start_date}_{limit or 'all'}"
+        cache_key = scenario_cache_key(site, start_date, limit, site_max_power)
         scenario = None
         
         if self.cache:
@@ -82,12 +184,21 @@ class OptimizeChargingUseCase:
         
         # Fetch and build scenario if not cached
         if scenario is None:
-            # Fetch sessions
-            sessions = self.real_data_source.fetch_sessions(
-                start_date=start_date,
-                site=site,
-                limit=limit
-            )
+            # Fetch sessions (unless the caller already has or is fetching them)
+            if prefetched_sessions is None and sessions_future is not None:
+                try:
+                    prefetched_sessions = sessions_future.result()
+                except Exception as e:
+                    logger.warning(f"Background session fetch failed, fetching again: {e}")
+            
+            if prefetched_sessions is not None:
+                sessions = prefetched_sessions[:limit] if limit else prefetched_sessions
+            else:
+                sessions = self.real_data_source.fetch_sessions(
+                    start_date=start_date,
+                    site=site,
+                    limit=limit
+                )
             
             # Build scenario
             scenario = self.real_data_source.build_scenario(
@@ -95,9 +206,13 @@ class OptimizeChargingUseCase:
                 site_max_power=site_max_power
             )
             
-            # Cache scenario
+            # Cache scenario (sessions of past days are final: keep them forever)
             if self.cache:
-                self.cache.set(cache_key, scenario, ttl=timedelta(hours=24))
+                if start_date < date.today() - timedelta(days=1):
+                    ttl = NEVER_EXPIRE
+                else:
+                    ttl = timedelta(hours=24)
+                self.cache.set(cache_key, scenario, ttl=ttl)
         
         # Optimize
         result = self.optimizer.optimize(scenario)
@@ -155,38 +270,34 @@ class OptimizeChargingUseCase:
     
     def _save_results(self, result: OptimizationResult, output_dir: Path):
         """Save optimization results to files."""
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # One mkdir chain (metrics/ only when there are metrics) and one strftime
+        metrics_dir = output_dir / "metrics"
+        (metrics_dir if result.performance_metrics else output_dir).mkdir(parents=True, exist_ok=True)
+        ts = result.timestamp.strftime('%Y%m%d_%H%M%S')
         
         # Save JSON summary
-        json_path = output_dir / f"result_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+        json_path = output_dir / f"result_{ts}.json"
         result.to_json(str(json_path))
         logger.info(f"Saved result to {json_path}")
         
         # Save schedule CSV
-        csv_path = output_dir / f"schedule_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.csv"
+        csv_path = output_dir / f"schedule_{ts}.csv"
         result.save_schedule_csv(str(csv_path))
         logger.info(f"Saved schedule to {csv_path}")
         
         # Save Pareto front if available
         if result.pareto_front is not None:
-            pareto_path = output_dir / f"pareto_front_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.csv"
+            pareto_path = output_dir / f"pareto_front_{ts}.csv"
             result.save_pareto_front_csv(str(pareto_path))
             logger.info(f"Saved Pareto front ({len(result.pareto_front)} solutions) to {pareto_path}")
 
         # Save performance metrics
         if result.performance_metrics:
-            metrics_dir = output_dir / "metrics"
-            metrics_dir.mkdir(exist_ok=True)
-            
-            metrics_path = metrics_dir / f"metrics_{result.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-            with open(metrics_path, 'w') as f:
-                import json
-                json.dump(result.performance_metrics, f, indent=2)
+            metrics_path = metrics_dir / f"metrics_{ts}.json"
+            metrics_path.write_bytes(dumps_json(result.performance_metrics))
             logger.info(f"Saved metrics to {metrics_path}")
             
             # Print summary to console
-            try:
-                from ...services.metrics_calculator import MetricsCalculator
-                MetricsCalculator().print_summary(result.performance_metrics)
-            except ImportError:
-                pass
+            metrics_calculator = _metrics_calculator()
+            if metrics_calculator is not None:
+                metrics_calculator.print_summary(result.performance_metrics)
@@ -1,16 +1,51 @@
 """
 Interactive menu for user configuration.
 """
+import hashlib
 from typing import Optional, List, Tuple
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import sys
 
+import numpy as np
+import pandas as pd
+
 from ..infrastructure.repositories.caltech_repository import CaltechRepository
+from ..infrastructure.cache.file_cache import FileCache
+from ..core.exceptions import CacheError
 from ..config.settings import settings
 from ..config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds the menu waits for the session statistics before going on without
+# them (the fetch keeps running in the background for the optimization)
+STATS_PREVIEW_TIMEOUT = 5.0
+
+# Available dates are kept on disk so that successive interactive runs share one probe
+DATES_CACHE_TTL = timedelta(hours=1)
+
+
+def _int_or(raw: Optional[str], default):
+    """Parse a positive integer input, returning default if empty, invalid or <= 0."""
+    s = (raw or "").strip()
+    # isascii: str.isdigit also accepts digits int() rejects (e.g. superscripts)
+    if not (s.isascii() and s.isdigit()):
+        return default
+    value = int(s)
+    return value if value > 0 else default
+
+
+def _float_or(raw: Optional[str], default):
+    """Parse a float input, returning default if empty or invalid."""
+    s = (raw or "").strip()
+    if not s:
+        return default
+    try:
+        return float(s)
+    except ValueError:
+        return default
+
 
 def get_available_dates(
     repository: CaltechRepository,
@@ -30,29 +65,18 @@ def get_available_dates(
     """
     logger.info(f"Fetching available dates from {site}...")
     
-    # Query API for latest sessions (without date filter to get any available)
     try:
-        url = f"{repository.api_url}/{site}"
-        params = {
-            "max_results": 100,  # Get last 100 sessions
-            "sort": "-connectionTime"  # Descending order
-        }
+        cache = FileCache(cache_dir=settings.cache_dir, default_ttl=DATES_CACHE_TTL)
+        cache_key = _dates_cache_key(repository.api_url, site, limit)
         
-        data = repository._make_request(url, params)
-        sessions_data = data.get("_items", [])
+        available_dates = cache.get(cache_key)
+        if available_dates is None:
+            available_dates = _fetch_available_dates(repository, site, limit)
+            try:
+                cache.set(cache_key, available_dates)
+            except CacheError as e:
+                logger.warning(f"Could not cache available dates: {e}")
         
-        # Extract unique dates
-        dates_set = set()
-        for item in sessions_data:
-            if "connectionTime" in item:
-                try:
-                    conn_time = datetime.strptime(item["connectionTime"], "%a, %d %b %Y %H:%M:%S %Z")
-                    dates_set.add(conn_time.date().isoformat())
-                except:
-                    pass
-        
-        # Sort descending and limit
-        available_dates = sorted(list(dates_set), reverse=True)[:limit]
         logger.info(f"Found {len(available_dates)} dates with data")
         
         return available_dates
@@ -63,16 +87,51 @@ def get_available_dates(
         return [settings.caltech_date]
 
 
+def _dates_cache_key(api_url: str, site: str, limit: int) -> str:
+    """File cache key of the available dates of a site."""
+    fingerprint = f"{api_url}|{site}|{limit}".encode()
+    return "dates_" + hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+
+
+def _fetch_available_dates(repository: CaltechRepository, site: str, limit: int) -> List[str]:
+    """Query the latest sessions and return their distinct dates (errors propagate)."""
+    # Query API for latest sessions (without date filter to get any available)
+    url = repository.site_url(site)
+    params = {
+        "max_results": 100,  # Get last 100 sessions
+        "sort": "-connectionTime"  # Descending order
+    }
+    
+    data = repository._make_request(url, params)
+    sessions_data = data.get("_items", [])
+    
+    # Parse all timestamps in one vectorized call (unparsable ones become NaT)
+    raw = [item["connectionTime"] for item in sessions_data if "connectionTime" in item]
+    timestamps = pd.to_datetime(
+        pd.Series(raw, dtype=object),
+        format="%a, %d %b %Y %H:%M:%S GMT",
+        utc=True,
+        errors="coerce"
+    )
+    
+    # Unique days as integer YYYYMMDD keys (no per-row strftime), latest first
+    timestamps = timestamps.dropna()
+    day_keys = np.unique(
+        (timestamps.dt.year * 10000 + timestamps.dt.month * 100 + timestamps.dt.day).to_numpy()
+    )[::-1][:limit]
+    return [f"{k // 10000:04d}-{k // 100 % 100:02d}-{k % 100:02d}" for k in day_keys.tolist()]
+
+
 def interactive_menu() -> dict:
     """
     Display interactive menu for user to configure optimization.
     
     Returns:
-        Dictionary with user selections
+        Dictionary with user selections ('sessions' holds the sessions
+        fetched for the selected date, or None if they were not fetched;
+        '_prefetch' holds the still running background fetch, if any)
     """
-    print("\n" + "="*70)
-    print("  🚗 EV Charging Optimizer - Configuration Interactive")
-    print("="*70 + "\n")
+    print("\n" + "="*70 + "\n  🚗 EV Charging Optimizer - Configuration Interactive\n" + "="*70 + "\n")
     
     config = {}
     
@@ -98,14 +157,14 @@ def interactive_menu() -> dict:
         available_dates = get_available_dates(repository, config['site'])
         
         if available_dates:
-            print("\n   Dates disponibles avec des données :")
-            for i, date_str in enumerate(available_dates[:10], 1):
-                print(f"   {i}. {date_str}")
-            
-            print(f"\n   Ou entrez une date manuelle (YYYY-MM-DD)")
+            print("\n".join(
+                ["\n   Dates disponibles avec des données :"]
+                + [f"   {i}. {date_str}" for i, date_str in enumerate(available_dates[:10], 1)]
+                + ["\n   Ou entrez une date manuelle (YYYY-MM-DD)"]
+            ))
             date_input = input(f"   Choisir [1-{min(10, len(available_dates))}] ou date [défaut: {settings.caltech_date}]: ").strip()
             
-            if date_input.isdigit() and 1 <= int(date_input) <= len(available_dates):
+            if date_input.isascii() and date_input.isdigit() and 1 <= int(date_input) <= len(available_dates):
                 config['date'] = available_dates[int(date_input) - 1]
             elif date_input:
                 config['date'] = date_input
@@ -121,31 +180,50 @@ def interactive_menu() -> dict:
     # 2.5. Get stats for selected date
     max_vehicles_available = None
     suggested_power = None
+    config['sessions'] = None
+    config['_prefetch'] = None
     
     if can_fetch_dates:
         try:
-            from datetime import datetime
             selected_date = datetime.strptime(config['date'], "%Y-%m-%d").date()
             
             print(f"\n   📊 Analyse des données pour {config['date']}...")
             
-            # Fetch all sessions for that date
-            sessions = repository.fetch_sessions(
+            # Fetch all sessions for that date in the background: if the API
+            # is slow, the remaining prompts overlap the download
+            executor = ThreadPoolExecutor(max_workers=1)
+            future = executor.submit(
+                repository.fetch_sessions,
                 start_date=selected_date,
                 site=config['site'],
                 limit=None  # Get all
             )
+            executor.shutdown(wait=False)
             
-            max_vehicles_available = len(sessions)
-            
-            # Calculate suggested power (sum of max charging rates)
-            if sessions:
-                total_power = sum(min(30.0, s.kwh_delivered) for s in sessions[:50])  # Estimate
-                suggested_power = round(total_power / 2, 1)  # Rough estimate
-            
-            print(f"   ✓ {max_vehicles_available} sessions de charge détectées")
-            if suggested_power:
-                print(f"   ✓ Puissance suggérée pour ce jour : ~{suggested_power} kW")
+            try:
+                sessions = future.result(timeout=STATS_PREVIEW_TIMEOUT)
+            except FutureTimeoutError:
+                # Slow API: skip the statistics, the optimization resolves the fetch if needed
+                config['_prefetch'] = future
+                logger.info(f"No session data after {STATS_PREVIEW_TIMEOUT:.0f}s, skipping statistics")
+                print(f"   ⏳ Pas de réponse après {STATS_PREVIEW_TIMEOUT:.0f}s, statistiques ignorées")
+            else:
+                config['sessions'] = sessions  # Reused by the optimization, no second fetch
+                max_vehicles_available = len(sessions)
+                
+                # Calculate suggested power (sum of max charging rates)
+                if sessions:
+                    kwh = np.fromiter(
+                        (s.kwh_delivered for s in sessions[:50]),
+                        dtype=np.float64,
+                        count=min(50, len(sessions))
+                    )
+                    total_power = float(np.minimum(kwh, 30.0).sum())  # Estimate
+                    suggested_power = round(total_power / 2, 1)  # Rough estimate
+                
+                print(f"   ✓ {max_vehicles_available} sessions de charge détectées")
+                if suggested_power:
+                    print(f"   ✓ Puissance suggérée pour ce jour : ~{suggested_power} kW")
                 
         except Exception as e:
             logger.warning(f"Could not fetch stats: {e}")
@@ -154,58 +232,53 @@ def interactive_menu() -> dict:
     print(f"\n🚙 Nombre de véhicules")
     if max_vehicles_available:
         print(f"   Maximum disponible pour cette date : {max_vehicles_available}")
-        limit_input = input(f"   Nombre de véhicules [défaut: {min(settings.caltech_limit, max_vehicles_available)}]: ").strip()
+        default_limit = min(settings.caltech_limit, max_vehicles_available)
+        limit_input = input(f"   Nombre de véhicules [défaut: {default_limit}]: ")
     else:
-        limit_input = input(f"   Nombre maximum de véhicules [défaut: {settings.caltech_limit}]: ").strip()
+        default_limit = settings.caltech_limit
+        limit_input = input(f"   Nombre maximum de véhicules [défaut: {default_limit}]: ")
     
-    if limit_input.isdigit():
-        config['limit'] = int(limit_input)
-    else:
-        config['limit'] = min(settings.caltech_limit, max_vehicles_available) if max_vehicles_available else settings.caltech_limit
+    config['limit'] = _int_or(limit_input, default_limit)
     
     # 4. Site max power (optional)
     print(f"\n⚡ Puissance maximale du site")
     if suggested_power:
         print(f"   Puissance suggérée basée sur les données : {suggested_power} kW")
-        power_input = input(f"   Puissance max (kW) [défaut: {suggested_power}]: ").strip()
+        power_input = input(f"   Puissance max (kW) [défaut: {suggested_power}]: ")
         default_power = suggested_power
     else:
-        power_input = input(f"   Puissance max (kW) [défaut: {settings.site_max_power}]: ").strip()
+        power_input = input(f"   Puissance max (kW) [défaut: {settings.site_max_power}]: ")
         default_power = settings.site_max_power
     
-    if power_input:
-        try:
-            config['site_max_power'] = float(power_input)
-        except:
-            config['site_max_power'] = default_power
-    else:
-        config['site_max_power'] = default_power
+    config['site_max_power'] = _float_or(power_input, default_power)
     
     # 5. GDE3 parameters (advanced, optional)
     print(f"\n🧬 Paramètres algorithme GDE3 (optionnel)")
     advanced = input(f"   Configurer les paramètres avancés ? [o/N]: ").strip().lower()
     
     if advanced == 'o' or advanced == 'oui':
-        gen_input = input(f"   Nombre de générations [défaut: {settings.gde3_n_gen}]: ").strip()
-        config['generations'] = int(gen_input) if gen_input.isdigit() else settings.gde3_n_gen
+        gen_input = input(f"   Nombre de générations [défaut: {settings.mode_n_gen}]: ")
+        config['generations'] = _int_or(gen_input, settings.mode_n_gen)
         
-        pop_input = input(f"   Taille de population [défaut: {settings.gde3_pop_size}]: ").strip()
-        config['population'] = int(pop_input) if pop_input.isdigit() else settings.gde3_pop_size
+        pop_input = input(f"   Taille de population [défaut: {settings.mode_pop_size}]: ")
+        config['population'] = _int_or(pop_input, settings.mode_pop_size)
     else:
-        config['generations'] = settings.gde3_n_gen
-        config['population'] = settings.gde3_pop_size
+        config['generations'] = settings.mode_n_gen
+        config['population'] = settings.mode_pop_size
     
     # Summary
-    print("\n" + "="*70)
-    print("  📋 Résumé de la configuration")
-    print("="*70)
-    print(f"  Site:           {config['site']}")
-    print(f"  Date:           {config['date']}")
-    print(f"  Véhicules:      {config['limit']}")
-    print(f"  Puissance site: {config['site_max_power']} kW")
-    print(f"  GDE3 gens:      {config['generations']}")
-    print(f"  GDE3 pop:       {config['population']}")
-    print("="*70 + "\n")
+    print("\n".join([
+        "\n" + "="*70,
+        "  📋 Résumé de la configuration",
+        "="*70,
+        f"  Site:           {config['site']}",
+        f"  Date:           {config['date']}",
+        f"  Véhicules:      {config['limit']}",
+        f"  Puissance site: {config['site_max_power']} kW",
+        f"  GDE3 gens:      {config['generations']}",
+        f"  GDE3 pop:       {config['population']}",
+        "="*70 + "\n"
+    ]))
     
     confirm = input("  Lancer l'optimisation ? [O/n]: ").strip().lower()
     if confirm == 'n' or confirm == 'non':
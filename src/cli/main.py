@@ -8,12 +8,9 @@ from pathlib import Path
 
 from ..config.settings import settings
 from ..config.logging_config import setup_logging, get_logger
-from ..services.optimization_service import MODEOptimizerService
-from ..infrastructure.repositories.caltech_repository import CaltechRepository
-from ..infrastructure.repositories.synthetic_generator import SyntheticDataGenerator
-from ..infrastructure.cache.file_cache import FileCache
-from ..application.use_cases.optimize_charging import OptimizeChargingUseCase
-from .interactive import interactive_menu
+
+# Heavy modules (NumPy, pymoo, requests...) are imported inside main(),
+# once the arguments are parsed, so that --help stays instantaneous
 
 # Setup logging
 setup_logging(level=settings.log_level, log_file=settings.log_file)
@@ -35,6 +32,9 @@ Examples:
   
   # Custom configuration
   python -m src.cli.main --real-data --site jpl --vehicles 50
+  
+  # Single schedule without Pareto front (much faster)
+  python -m src.cli.main --no-pareto
         """
     )
     
@@ -105,6 +105,15 @@ Examples:
         help=f'MODE population size (default: {settings.mode_pop_size})'
     )
     
+    parser.add_argument(
+        '--pareto',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Compute the Pareto front with MODE; --no-pareto uses the '
+             'single-schedule solver set by SINGLE_OBJECTIVE_SOLVER '
+             '(valley filling by default) (default: --pareto)'
+    )
+    
     # Output options
     parser.add_argument(
         '--output-dir',
@@ -146,7 +155,10 @@ def main():
         setup_logging(level="DEBUG")
     
     # Interactive mode - override args with menu selections
+    prefetched_sessions = None
+    sessions_future = None
     if args.interactive:
+        from .interactive import interactive_menu
         interactive_config = interactive_menu()
         # Override CLI args with interactive selections
         args.real_data = True  # Interactive mode always uses real data
@@ -156,32 +168,40 @@ def main():
         args.site_power = interactive_config['site_max_power']
         args.generations = interactive_config['generations']
         args.population = interactive_config['population']
+        prefetched_sessions = interactive_config['sessions']
+        sessions_future = interactive_config['_prefetch']
     
-    # Print banner
-    print(f"\n{'='*70}")
-    print(f"  {settings.app_name} v{settings.app_version}")
-    print(f"{'='*70}\n")
+    # Print banner (each block is written with a single print call)
+    print(f"\n{'='*70}\n  {settings.app_name} v{settings.app_version}\n{'='*70}\n")
     
     try:
         # Initialize components
         logger.info("Initializing components...")
         
+        from ..infrastructure.repositories.synthetic_generator import SyntheticDataGenerator
+        from ..infrastructure.cache.file_cache import FileCache
+        from ..application.use_cases.optimize_charging import OptimizeChargingUseCase
+        
         # Cache
         cache = FileCache(
             cache_dir=settings.cache_dir,
             default_ttl=timedelta(seconds=settings.cache_ttl),
-            use_pickle=True  # Use pickle to cache complex objects like Scenario
+            use_arrow=True  # Columnar Arrow IPC files for Scenario objects
         )
         
-        # Optimizer
-        optimizer_config = settings.get_optimizer_config()
-        optimizer_config['n_gen'] = args.generations
-        optimizer_config['pop_size'] = args.population
-        optimizer = MODEOptimizerService(config=optimizer_config)
+        # Optimizer (MODE only when the Pareto front is requested)
+        optimizer = None
+        if args.pareto:
+            from ..services.optimization_service import MODEOptimizerService
+            optimizer_config = settings.get_optimizer_config()
+            optimizer_config['n_gen'] = args.generations
+            optimizer_config['pop_size'] = args.population
+            optimizer = MODEOptimizerService(config=optimizer_config)
         
         # Data sources
         caltech_repo = None
         if args.real_data:
+            from ..infrastructure.repositories.caltech_repository import CaltechRepository
             try:
                 caltech_repo = CaltechRepository()
             except ValueError as e:
@@ -197,7 +217,8 @@ def main():
             optimizer=optimizer,
             real_data_source=caltech_repo,
             synthetic_data_source=synthetic_gen,
-            cache=cache
+            cache=cache,
+            optimize_pareto=args.pareto
         )
         
         # Execute
@@ -205,11 +226,13 @@ def main():
             # Parse date
             optimization_date = datetime.strptime(args.date, "%Y-%m-%d").date()
             
-            print(f"🌐 MODE: Real Data")
-            print(f"   Site: {args.site}")
-            print(f"   Date: {optimization_date}")
-            print(f"   Limit: {args.limit or 'None'}")
-            print(f"{'='*70}\n")
+            print("\n".join([
+                "🌐 MODE: Real Data",
+                f"   Site: {args.site}",
+                f"   Date: {optimization_date}",
+                f"   Limit: {args.limit or 'None'}",
+                f"{'='*70}\n"
+            ]))
             
             result = use_case.execute_real_data(
                 start_date=optimization_date,
@@ -217,14 +240,18 @@ def main():
                 site_max_power=args.site_power,
                 limit=args.limit,
                 save_results=not args.no_save,
-                output_dir=args.output_dir
+                output_dir=args.output_dir,
+                prefetched_sessions=prefetched_sessions,
+                sessions_future=sessions_future
             )
         else:
-            print(f"🔧 MODE: Synthetic Data")
-            print(f"   Vehicles: {args.vehicles}")
-            print(f"   Horizon: {args.horizon}h")
-            print(f"   Site Power: {args.site_power}kW")
-            print(f"{'='*70}\n")
+            print("\n".join([
+                "🔧 MODE: Synthetic Data",
+                f"   Vehicles: {args.vehicles}",
+                f"   Horizon: {args.horizon}h",
+                f"   Site Power: {args.site_power}kW",
+                f"{'='*70}\n"
+            ]))
             
             result = use_case.execute_synthetic(
                 n_vehicles=args.vehicles,
@@ -235,24 +262,27 @@ def main():
             )
         
         # Display results
-        print(f"\n{'='*70}")
-        print(f"✅ OPTIMIZATION SUCCESSFUL")
-        print(f"{'='*70}")
-        print(f"\n📊 Results:")
-        print(f"   Cost:            {result.metrics.cost:.2f} €")
-        print(f"   Dissatisfaction: {result.metrics.dissatisfaction:.4f}")
-        print(f"   Peak Power:      {result.metrics.peak_power:.2f} kW")
-        print(f"   Execution Time:  {result.execution_time:.2f} s")
-        print(f"   Solutions Found: {result.solutions_found}")
-        print(f"\n📋 Schedule:")
-        print(f"   Vehicles:        {result.n_vehicles}")
-        print(f"   Time Horizon:    {result.n_hours}h")
-        print(f"   Total Energy:    {result.charging_schedule.sum():.2f} kWh")
+        lines = [
+            f"\n{'='*70}",
+            "✅ OPTIMIZATION SUCCESSFUL",
+            f"{'='*70}",
+            "\n📊 Results:",
+            f"   Cost:            {result.metrics.cost:.2f} €",
+            f"   Dissatisfaction: {result.metrics.dissatisfaction:.4f}",
+            f"   Peak Power:      {result.metrics.peak_power:.2f} kW",
+            f"   Execution Time:  {result.execution_time:.2f} s",
+            f"   Solutions Found: {result.solutions_found}",
+            "\n📋 Schedule:",
+            f"   Vehicles:        {result.n_vehicles}",
+            f"   Time Horizon:    {result.n_hours}h",
+            f"   Total Energy:    {result.charging_schedule.sum(dtype=float):.2f} kWh"
+        ]
         
         if not args.no_save:
-            print(f"\n💾 Results saved to: {args.output_dir}/")
+            lines.append(f"\n💾 Results saved to: {args.output_dir}/")
         
-        print(f"\n{'='*70}\n")
+        lines.append(f"\n{'='*70}\n")
+        print("\n".join(lines))
         
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
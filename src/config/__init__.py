@@ -1 +1 @@
-"""Configuration management with Pydantic."""
+"""Configuration management."""
@@ -1,82 +1,116 @@
 """
-Centralized application settings using Pydantic.
+Centralized application settings.
+
+Settings are read once from the environment (and the ``.env`` file) into a
+frozen dataclass: no per-field validator dispatch at import time.
 """
-from pydantic_settings import BaseSettings
-from pydantic import Field, SecretStr
-from typing import Optional
+import os
+from dataclasses import dataclass, field, fields
+from typing import Optional, Union, get_args, get_origin
 from pathlib import Path
 
+from dotenv import dotenv_values
+
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables.
     """
-    
+
     # API Configuration
-    caltech_api_url: str = Field(
-        default="https://ev.caltech.edu/api/v1/sessions",
-        description="Base URL for Caltech ACN-Data API"
-    )
-    caltech_api_key: Optional[SecretStr] = Field(
-        default=None,
-        description="API key for Caltech authentication"
-    )
-    caltech_site: str = Field(
-        default="caltech",
-        description="Caltech site ID (caltech, jpl, office001)"
-    )
-    caltech_date: str = Field(
-        default="2019-07-15",
-        description="Date for real data (YYYY-MM-DD)"
-    )
-    caltech_limit: Optional[int] = Field(
-        default=30,
-        description="Max number of vehicles to fetch from Caltech API",
-        ge=1
-    )
-    
+    caltech_api_url: str = "https://ev.caltech.edu/api/v1/sessions"  # Base URL for Caltech ACN-Data API
+    caltech_api_key: Optional[str] = field(default=None, repr=False)  # API key for Caltech authentication (kept out of repr)
+    caltech_site: str = "caltech"  # Caltech site ID (caltech, jpl, office001)
+    caltech_date: str = "2019-07-15"  # Date for real data (YYYY-MM-DD)
+    caltech_limit: Optional[int] = 30  # Max number of vehicles to fetch from Caltech API
+
     # Optimization Parameters
-    n_vehicles: int = Field(default=30, description="Number of vehicles (synthetic mode)", ge=1)
-    t_horizon: int = Field(default=24, description="Time horizon in hours", ge=1, le=168)
-    dt: float = Field(default=1.0, description="Time step in hours", gt=0)
-    
+    n_vehicles: int = 30  # Number of vehicles (synthetic mode)
+    t_horizon: int = 24  # Time horizon in hours
+    dt: float = 1.0  # Time step in hours
+
     # Battery & Power
-    battery_capacity: float = Field(default=30.0, description="Default battery capacity in kWh", gt=0)
-    charging_power_min: float = Field(default=-6.0, description="Min charging power (V2G) in kW")
-    charging_power_max: float = Field(default=30.0, description="Max charging power in kW", gt=0)
-    site_max_power: float = Field(default=60.0, description="Site transformer capacity in kW", gt=0)
-    
+    battery_capacity: float = 30.0  # Default battery capacity in kWh
+    charging_power_min: float = -6.0  # Min charging power (V2G) in kW
+    charging_power_max: float = 30.0  # Max charging power in kW
+    site_max_power: float = 60.0  # Site transformer capacity in kW
+
     # MODE Algorithm Parameters (Multi-Objective Differential Evolution)
-    mode_pop_size: int = Field(default=100, description="Population size", ge=10)
-    mode_n_gen: int = Field(default=1500, description="Number of generations", ge=100)
-    mode_variant: str = Field(default="DE/rand/1/bin", description="DE variant")
-    mode_cr: float = Field(default=0.9, description="Crossover rate", ge=0, le=1)
-    mode_f: float = Field(default=0.5, description="Mutation factor", ge=0, le=2)
-    
+    mode_pop_size: int = 100  # Population size
+    mode_n_gen: int = 1500  # Number of generations
+    mode_variant: str = "DE/rand/1/bin"  # DE variant
+    mode_cr: float = 0.9  # Crossover rate
+    mode_f: float = 0.5  # Mutation factor
+    mode_warm_start: bool = True  # Seed the population with a heuristic schedule
+    mode_adaptive_termination: bool = False  # Stop before n_gen once the front converges
+    mode_constraint_penalty: float = 0.0  # Fold constraints into the objectives with this weight (0 keeps explicit constraints)
+    mode_device: str = "cpu"  # Fitness evaluation device: cpu, or cuda (requires CuPy)
+
+    # Valley Filling (single-objective closed-form solver)
+    valley_price_weight: float = 100.0  # Price weight in the fill level (kW per currency/kWh, 0 = pure peak shaving)
+
+    # SciPy Differential Evolution (single weighted objective)
+    single_objective_solver: str = "valley"  # Solver used without Pareto front: valley or scipy_de
+    scipy_de_pop_size: int = 50  # Population size
+    scipy_de_maxiter: int = 1000  # Maximum number of generations
+    scipy_de_cr: float = 0.9  # Crossover rate
+    scipy_de_f: float = 0.5  # Mutation factor
+    scipy_de_warm_start: bool = True  # Seed the population with a heuristic schedule
+    scipy_de_cost_weight: float = 1.0  # Weight of the cost in the weighted sum
+    scipy_de_dissatisfaction_weight: float = 100.0  # Weight of the dissatisfaction in the weighted sum
+    scipy_de_peak_weight: float = 1.0  # Weight of the peak power in the weighted sum
+    scipy_de_constraint_penalty: float = 1000.0  # Weight of the constraint violations in the weighted sum
+
     # Infrastructure
-    cache_dir: Path = Field(default=Path("data_cache"), description="Cache directory path")
-    cache_ttl: int = Field(default=3600, description="Cache TTL in seconds", ge=0)
-    log_level: str = Field(default="INFO", description="Logging level")
-    log_file: Optional[Path] = Field(default=None, description="Log file path")
-    
+    cache_dir: Path = Path("data_cache")  # Cache directory path
+    cache_ttl: int = 3600  # Cache TTL in seconds
+    log_level: str = "INFO"  # Logging level
+    log_file: Optional[Path] = None  # Log file path
+
     # Application
-    app_name: str = Field(default="EV Charging Optimizer", description="Application name")
-    app_version: str = Field(default="2.0.0", description="Application version")
-    environment: str = Field(default="development", description="Environment (development/production)")
-    
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra environment variables
-        
+    app_name: str = "EV Charging Optimizer"  # Application name
+    app_version: str = "2.0.0"  # Application version
+    environment: str = "development"  # Environment (development/production)
+
+    def __post_init__(self):
+        """Validate numeric ranges."""
+        checks = [
+            ('caltech_limit', self.caltech_limit is None or self.caltech_limit >= 1, ">= 1"),
+            ('n_vehicles', self.n_vehicles >= 1, ">= 1"),
+            ('t_horizon', 1 <= self.t_horizon <= 168, "between 1 and 168"),
+            ('dt', self.dt > 0, "> 0"),
+            ('battery_capacity', self.battery_capacity > 0, "> 0"),
+            ('charging_power_max', self.charging_power_max > 0, "> 0"),
+            ('site_max_power', self.site_max_power > 0, "> 0"),
+            ('mode_pop_size', self.mode_pop_size >= 10, ">= 10"),
+            ('mode_n_gen', self.mode_n_gen >= 100, ">= 100"),
+            ('mode_cr', 0 <= self.mode_cr <= 1, "between 0 and 1"),
+            ('mode_f', 0 <= self.mode_f <= 2, "between 0 and 2"),
+            ('mode_constraint_penalty', self.mode_constraint_penalty >= 0, ">= 0"),
+            ('mode_device', self.mode_device in ("cpu", "cuda"), "'cpu' or 'cuda'"),
+            ('valley_price_weight', self.valley_price_weight >= 0, ">= 0"),
+            ('single_objective_solver', self.single_objective_solver in ("valley", "scipy_de"), "'valley' or 'scipy_de'"),
+            ('scipy_de_pop_size', self.scipy_de_pop_size >= 5, ">= 5"),
+            ('scipy_de_maxiter', self.scipy_de_maxiter >= 1, ">= 1"),
+            ('scipy_de_cr', 0 <= self.scipy_de_cr <= 1, "between 0 and 1"),
+            ('scipy_de_f', 0 <= self.scipy_de_f <= 2, "between 0 and 2"),
+            ('scipy_de_cost_weight', self.scipy_de_cost_weight >= 0, ">= 0"),
+            ('scipy_de_dissatisfaction_weight', self.scipy_de_dissatisfaction_weight >= 0, ">= 0"),
+            ('scipy_de_peak_weight', self.scipy_de_peak_weight >= 0, ">= 0"),
+            ('scipy_de_constraint_penalty', self.scipy_de_constraint_penalty >= 0, ">= 0"),
+            ('cache_ttl', self.cache_ttl >= 0, ">= 0"),
+        ]
+        for name, valid, expected in checks:
+            if not valid:
+                raise ValueError(f"{name} must be {expected}, got {getattr(self, name)}")
+
     def get_api_key(self) -> str:
         """Get API key as string (raises if not set)."""
         if not self.caltech_api_key:
             raise ValueError("CALTECH_API_KEY not configured")
-        return self.caltech_api_key.get_secret_value()
-    
+        return self.caltech_api_key
+
     def get_optimizer_config(self) -> dict:
         """Get MODE optimizer configuration."""
         return {
@@ -84,9 +118,81 @@ class Settings(BaseSettings):
             'n_gen': self.mode_n_gen,
             'variant': self.mode_variant,
             'CR': self.mode_cr,
-            'F': self.mode_f
+            'F': self.mode_f,
+            'warm_start': self.mode_warm_start,
+            'adaptive_termination': self.mode_adaptive_termination,
+            'constraint_penalty': self.mode_constraint_penalty,
+            'device': self.mode_device
+        }
+
+    def get_valley_filling_config(self) -> dict:
+        """Get valley-filling optimizer configuration."""
+        return {
+            'price_weight': self.valley_price_weight
         }
 
+    def get_scipy_de_config(self) -> dict:
+        """Get SciPy differential evolution optimizer configuration."""
+        return {
+            'pop_size': self.scipy_de_pop_size,
+            'maxiter': self.scipy_de_maxiter,
+            'CR': self.scipy_de_cr,
+            'F': self.scipy_de_f,
+            'warm_start': self.scipy_de_warm_start,
+            'cost_weight': self.scipy_de_cost_weight,
+            'dissatisfaction_weight': self.scipy_de_dissatisfaction_weight,
+            'peak_weight': self.scipy_de_peak_weight,
+            'constraint_penalty': self.scipy_de_constraint_penalty
+        }
+
+
+def _cast(value: str, field_type):
+    """Convert a raw environment string to the annotated field type."""
+    if get_origin(field_type) is Union:
+        # Optional[X]: an empty value means None
+        if value.strip() == "":
+            return None
+        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
+
+    if field_type is bool:
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes", "on"):
+            return True
+        if lowered in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"Invalid boolean value: {value!r}")
+
+    return field_type(value.strip())
+
+
+def load_settings(env_file: Optional[Path] = Path(".env")) -> Settings:
+    """
+    Build settings from the ``.env`` file and the environment.
+
+    Environment variables take precedence over the ``.env`` file; names are
+    case-insensitive and unknown variables are ignored.
+
+    Args:
+        env_file: Optional dotenv file
+
+    Returns:
+        Frozen settings instance
+    """
+    raw = {}
+    if env_file is not None and Path(env_file).is_file():
+        raw.update({k.lower(): v for k, v in dotenv_values(env_file, encoding="utf-8").items() if v is not None})
+    raw.update({k.lower(): v for k, v in os.environ.items()})
+
+    values = {}
+    for f in fields(Settings):
+        if f.name in raw:
+            try:
+                values[f.name] = _cast(raw[f.name], f.type)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {f.name.upper()}: {e}")
+
+    return Settings(**values)
+
 
 # Global settings instance
-settings = Settings()
+settings = load_settings()
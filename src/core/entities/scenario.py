@@ -2,23 +2,31 @@
 Scenario entity representing a complete charging optimization scenario.
 """
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 import numpy as np
 
 from ..models.vehicle import Vehicle
+from .vehicle_array import VehicleArray
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """
     Complete charging scenario with vehicles, prices, and constraints.
     
+    Besides the vehicle list, the per-vehicle fields are stored column-wise
+    in a VehicleArray (structure of arrays) at construction so that
+    optimizers work on contiguous NumPy arrays instead of walking Vehicle
+    objects. The vehicle list is not expected to change after construction.
+    
     Attributes:
         vehicles: List of vehicles to charge
-        price_profile: Hourly electricity prices
+        price_profile: Hourly electricity prices (stored as a 1-D C-contiguous
+            float32 array whatever the input sequence)
         site_max_power: Maximum site power capacity in kW
         time_horizon: Number of hours in the planning horizon
         name: Optional scenario name
+        fleet: Vehicle columns (derived from vehicles)
     """
     vehicles: List[Vehicle]
     price_profile: np.ndarray
@@ -26,8 +34,17 @@ class Scenario:
     time_horizon: int = 24
     name: str = "default"
     
+    # Vehicle columns, derived from `vehicles` in __post_init__
+    fleet: VehicleArray = field(init=False, repr=False, compare=False)
+    _availability_mask: np.ndarray = field(init=False, default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate scenario."""
+        # Canonical dtype/layout for the (schedule x price) products
+        self.price_profile = np.ascontiguousarray(self.price_profile, dtype=np.float32)
+        if self.price_profile.ndim != 1:
+            raise ValueError(f"price_profile must be 1-D, got shape {self.price_profile.shape}")
+        
         if len(self.price_profile) != self.time_horizon:
             raise ValueError(
                 f"Price profile length ({len(self.price_profile)}) "
@@ -39,41 +56,96 @@ class Scenario:
         
         if not self.vehicles:
             raise ValueError("Scenario must have at least one vehicle")
+        
+        # Vehicle rules checked on the columns (vehicles built with validate=False)
+        self.fleet = VehicleArray.from_vehicles(self.vehicles)
+        self.fleet.validate()
+    
+    @property
+    def arrival(self) -> np.ndarray:
+        """Arrival hour per vehicle (int16)."""
+        return self.fleet.arrival_time
+    
+    @property
+    def departure(self) -> np.ndarray:
+        """Departure hour per vehicle (int16)."""
+        return self.fleet.departure_time
+    
+    @property
+    def battery_capacity(self) -> np.ndarray:
+        """Battery capacity per vehicle in kWh (float32)."""
+        return self.fleet.battery_capacity
+    
+    @property
+    def soc_initial(self) -> np.ndarray:
+        """Initial SoC per vehicle (float32)."""
+        return self.fleet.soc_initial
+    
+    @property
+    def soc_target(self) -> np.ndarray:
+        """Target SoC per vehicle (float32)."""
+        return self.fleet.soc_target
+    
+    @property
+    def energy_demand(self) -> np.ndarray:
+        """Energy needed to reach the target per vehicle in kWh (float32)."""
+        return self.fleet.energy_demand
+    
+    @property
+    def p_max(self) -> np.ndarray:
+        """Maximum charging power per vehicle in kW (float32)."""
+        return self.fleet.charging_power_max
     
     def get_availability_mask(self) -> np.ndarray:
         """
         Create availability mask for all vehicles.
         
+        The mask is built on the first call and shared afterwards.
+        
         Returns:
-            Boolean matrix (n_vehicles x time_horizon)
+            Read-only boolean matrix (n_vehicles x time_horizon)
         """
-        mask = np.zeros((len(self.vehicles), self.time_horizon), dtype=bool)
+        if self._availability_mask is not None:
+            return self._availability_mask
+        
+        hours = np.arange(self.time_horizon)[None, :]
+        arrival = self.arrival[:, None]
+        departure = self.departure[:, None]
         
-        for i, vehicle in enumerate(self.vehicles):
-            for hour in range(self.time_horizon):
-                mask[i, hour] = vehicle.available_at(hour)
+        # Same rule as Vehicle.available_at, broadcast over (vehicles x hours)
+        same_day = (hours >= arrival) & (hours < departure)
+        overnight = (hours >= arrival) | (hours < departure)
         
+        mask = np.where(departure > arrival, same_day, overnight)
+        mask.flags.writeable = False
+        self._availability_mask = mask
         return mask
     
-    def get_initial_soc_vector(self) -> np.ndarray:
-        """Get initial SoC for all vehicles."""
-        return np.array([v.soc_initial for v in self.vehicles])
+    @staticmethod
+    def _as(column: np.ndarray, dtype: Optional[np.dtype]) -> np.ndarray:
+        """Stored (read-only) column, or a writable copy in the requested dtype."""
+        return column if dtype is None else column.astype(dtype)
+    
+    def get_initial_soc_vector(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Get initial SoC for all vehicles (float32 unless dtype is given)."""
+        return self._as(self.soc_initial, dtype)
     
-    def get_target_soc_vector(self) -> np.ndarray:
-        """Get target SoC for all vehicles."""
-        return np.array([v.soc_target for v in self.vehicles])
+    def get_target_soc_vector(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Get target SoC for all vehicles (float32 unless dtype is given)."""
+        return self._as(self.soc_target, dtype)
     
-    def get_departure_times(self) -> np.ndarray:
-        """Get departure times for all vehicles."""
-        return np.array([v.departure_time for v in self.vehicles])
+    def get_departure_times(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Get departure times for all vehicles (int16 unless dtype is given)."""
+        return self._as(self.departure, dtype)
     
-    def get_battery_capacities(self) -> np.ndarray:
-        """Get battery capacities for all vehicles."""
-        return np.array([v.battery_capacity for v in self.vehicles])
+    def get_battery_capacities(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """Get battery capacities for all vehicles (float32 unless dtype is given)."""
+        return self._as(self.battery_capacity, dtype)
     
     def total_energy_demand(self) -> float:
         """Calculate total energy demand for all vehicles."""
-        return sum(v.energy_needed() for v in self.vehicles)
+        # float32 storage, float64 accumulation
+        return float(np.sum(self.energy_demand, dtype=np.float64))
     
     def is_feasible(self) -> bool:
         """
@@ -82,11 +154,14 @@ class Scenario:
         Returns:
             True if all vehicles can potentially be charged
         """
-        for vehicle in self.vehicles:
-            min_power = vehicle.minimum_charging_power()
-            if min_power > vehicle.charging_power_max:
-                return False
-        return True
+        # Same rule as Vehicle.minimum_charging_power (no presence: infinite power)
+        hours = self.fleet.hours_available
+        min_power = np.divide(
+            self.energy_demand, hours,
+            out=np.full(len(hours), np.inf, dtype=np.float32),
+            where=hours > 0
+        )
+        return bool((min_power <= self.p_max).all())
     
     def to_dict(self) -> dict:
         """Convert scenario to dictionary."""
@@ -0,0 +1,135 @@
+"""
+Columnar (structure of arrays) view of a fleet of vehicles.
+"""
+from dataclasses import dataclass, field
+from typing import List, Sequence
+import numpy as np
+
+from ..models.vehicle import Vehicle
+
+
+@dataclass
+class VehicleArray:
+    """
+    Vehicle fields stored as one contiguous NumPy array per field.
+
+    Column names match the Vehicle attributes, so a column can be gathered
+    or written (e.g. to an Arrow table) by attribute name. Columns are
+    read-only: getters hand them out without copying.
+
+    Attributes:
+        id: Vehicle identifiers (object)
+        user_id: Optional user identifiers (object)
+        battery_capacity: Battery capacity in kWh (float32)
+        soc_initial: Initial SoC (float32)
+        soc_target: Target SoC (float32)
+        arrival_time: Arrival hour (int16)
+        departure_time: Departure hour (int16)
+        charging_power_min: Minimum charging power in kW (float32)
+        charging_power_max: Maximum charging power in kW (float32)
+        energy_demand: Energy needed to reach the target in kWh (float32)
+        hours_available: Hours of presence, overnight stays wrap (int16)
+    """
+    id: np.ndarray
+    user_id: np.ndarray
+    battery_capacity: np.ndarray
+    soc_initial: np.ndarray
+    soc_target: np.ndarray
+    arrival_time: np.ndarray
+    departure_time: np.ndarray
+    charging_power_min: np.ndarray
+    charging_power_max: np.ndarray
+    energy_demand: np.ndarray = field(init=False, repr=False, compare=False)
+    hours_available: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # Column dtypes: float32 for kWh/SoC/kW, int16 for hours (half the bytes
+    # of float64/int32 for the optimizer passes); identifiers stay Python objects
+    DTYPES = {
+        'id': object,
+        'user_id': object,
+        'battery_capacity': np.float32,
+        'soc_initial': np.float32,
+        'soc_target': np.float32,
+        'arrival_time': np.int16,
+        'departure_time': np.int16,
+        'charging_power_min': np.float32,
+        'charging_power_max': np.float32,
+    }
+
+    def __post_init__(self):
+        """Cast the columns to their dtypes, derive the per-vehicle totals and freeze them."""
+        for name, dtype in self.DTYPES.items():
+            setattr(self, name, np.array(getattr(self, name), dtype=dtype, order='C'))
+
+        self.energy_demand = (self.soc_target - self.soc_initial) * self.battery_capacity
+        # Same rule as Vehicle.hours_available
+        self.hours_available = np.where(
+            self.departure_time > self.arrival_time,
+            self.departure_time - self.arrival_time,
+            24 - self.arrival_time + self.departure_time
+        ).astype(np.int16)
+        
+        for name in (*self.DTYPES, 'energy_demand', 'hours_available'):
+            getattr(self, name).flags.writeable = False
+
+    @classmethod
+    def from_vehicles(cls, vehicles: Sequence[Vehicle]) -> "VehicleArray":
+        """
+        Gather vehicle fields into columns (one pass per field).
+
+        Args:
+            vehicles: Vehicles to gather
+
+        Returns:
+            Columnar fleet
+        """
+        n = len(vehicles)
+        columns = {}
+        for name, dtype in cls.DTYPES.items():
+            if dtype is object:
+                column = np.empty(n, dtype=object)
+                column[:] = [getattr(v, name) for v in vehicles]
+            else:
+                column = np.fromiter((getattr(v, name) for v in vehicles), dtype=dtype, count=n)
+            columns[name] = column
+        return cls(**columns)
+
+    def validate(self):
+        """
+        Check all vehicles at once (same rules as Vehicle._validate).
+        
+        Raises:
+            ValueError: For the first vehicle breaking a rule
+        """
+        checks = [
+            ('soc_initial', (self.soc_initial >= 0) & (self.soc_initial <= 1), "between 0 and 1"),
+            ('soc_target', (self.soc_target >= 0) & (self.soc_target <= 1), "between 0 and 1"),
+            ('arrival_time', (self.arrival_time >= 0) & (self.arrival_time < 24), "between 0 and 23"),
+            ('departure_time', (self.departure_time >= 0) & (self.departure_time < 24), "between 0 and 23"),
+            ('battery_capacity', self.battery_capacity > 0, "positive"),
+        ]
+        for name, valid, expected in checks:
+            if not valid.all():
+                index = int(np.argmin(valid))  # First False
+                raise ValueError(
+                    f"Vehicle {index}: {name} must be {expected}, got {getattr(self, name)[index]}"
+                )
+    
+    def __len__(self) -> int:
+        return len(self.battery_capacity)
+
+    def vehicle(self, index: int) -> Vehicle:
+        """Rebuild the Vehicle object at index."""
+        return Vehicle(
+            **{name: getattr(self, name)[index:index + 1].tolist()[0] for name in self.DTYPES},
+            validate=False
+        )
+
+    def to_vehicles(self) -> List[Vehicle]:
+        """
+        Rebuild all Vehicle objects (for code working on the object API).
+
+        Float fields come back from float32, i.e. rounded to ~7 digits.
+        """
+        rows = zip(*(getattr(self, name).tolist() for name in self.DTYPES))
+        return [Vehicle(**dict(zip(self.DTYPES, row)), validate=False) for row in rows]
@@ -6,6 +6,10 @@ from typing import Optional, Any
 from datetime import timedelta
 
 
+# TTL marker for entries that must never expire (the default TTL is not applied)
+NEVER_EXPIRE = timedelta.max
+
+
 class ICache(ABC):
     """Interface for caching implementations."""
     
@@ -30,7 +34,7 @@ class ICache(ABC):
         Args:
             key: Cache key
             value: Value to cache
-            ttl: Time-to-live (optional)
+            ttl: Time-to-live (optional, NEVER_EXPIRE disables expiration)
         """
         pass
     
@@ -3,10 +3,11 @@ Charging session model representing real-world charging data.
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Sequence
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class ChargingSession:
     """
     Represents a real charging session from Caltech dataset.
@@ -64,6 +65,58 @@ class ChargingSession:
         """Get departure hour (0-23)."""
         return self.disconnection_time.hour
     
+    @staticmethod
+    def batch_to_arrays(sessions: Sequence["ChargingSession"]) -> Dict[str, np.ndarray]:
+        """
+        Gather a list of sessions into columns for vectorized processing.
+        
+        Timestamps are converted as wall-clock times (like .hour on the
+        datetimes), so the hours match arrival_hour()/departure_hour().
+        
+        Args:
+            sessions: Sessions to gather
+            
+        Returns:
+            Dictionary of arrays: 'kwh_delivered' (float64), 'connection_time'
+            and 'disconnection_time' (datetime64[s]), 'duration_hours'
+            (float64), 'arrival_hour' and 'departure_hour' (int16),
+            'user_id' (object)
+        """
+        n = len(sessions)
+        kwh = np.fromiter((s.kwh_delivered for s in sessions), dtype=np.float64, count=n)
+        connection = np.array([s.connection_time for s in sessions], dtype='datetime64[s]').reshape(n)
+        disconnection = np.array([s.disconnection_time for s in sessions], dtype='datetime64[s]').reshape(n)
+        user_id = np.empty(n, dtype=object)
+        user_id[:] = [s.user_id for s in sessions]
+        
+        return ChargingSession.columns(kwh, connection, disconnection, user_id)
+    
+    @staticmethod
+    def columns(
+        kwh_delivered: np.ndarray,
+        connection: np.ndarray,
+        disconnection: np.ndarray,
+        user_id: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Session columns (as returned by batch_to_arrays) from the raw field arrays.
+        
+        Args:
+            kwh_delivered: Energy per session (float64)
+            connection: Connection times (datetime64[s])
+            disconnection: Disconnection times (datetime64[s])
+            user_id: User identifiers (object)
+        """
+        return {
+            'kwh_delivered': kwh_delivered,
+            'connection_time': connection,
+            'disconnection_time': disconnection,
+            'duration_hours': (disconnection - connection).astype(np.float64) / 3600,
+            'arrival_hour': (connection.astype('datetime64[h]').astype(np.int64) % 24).astype(np.int16),
+            'departure_hour': (disconnection.astype('datetime64[h]').astype(np.int64) % 24).astype(np.int16),
+            'user_id': user_id
+        }
+    
     def to_dict(self) -> dict:
         """Convert session to dictionary representation."""
         return {
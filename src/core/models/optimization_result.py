@@ -3,12 +3,52 @@ Optimization result model.
 """
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
+from pathlib import Path
 import numpy as np
 from datetime import datetime
-import json
 
+from ..serialization import dumps_json
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+
+# Below this many cells the two NumPy reductions are cheaper than loading
+# the compiled single-pass kernel (about 0.2s per process, even from cache)
+FUSED_SUMS_MIN_SIZE = 1_000_000
+
+
+def _schedule_sums_numpy(schedule: np.ndarray):
+    """Row and column sums of the schedule, accumulated in float64."""
+    return (
+        np.einsum('ij->i', schedule, dtype=np.float64),
+        np.einsum('ij->j', schedule, dtype=np.float64)
+    )
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _schedule_sums(schedule):
+        """Row and column sums (float64) in a single pass over the schedule."""
+        n_vehicles, n_hours = schedule.shape
+        row_sums = np.zeros(n_vehicles)
+        col_sums = np.zeros(n_hours)
+        for i in range(n_vehicles):
+            acc = 0.0
+            for j in range(n_hours):
+                value = schedule[i, j]
+                acc += value
+                col_sums[j] += value
+            row_sums[i] = acc
+        return row_sums, col_sums
+
+else:
+    _schedule_sums = None
+
+
+@dataclass(slots=True)
 class OptimizationMetrics:
     """Metrics from optimization result."""
     cost: float  # Total cost in currency units
@@ -24,14 +64,14 @@ class OptimizationMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationResult:
     """
     Complete optimization result.
     
     Attributes:
         metrics: Optimization metrics
-        charging_schedule: Power schedule matrix (vehicles x hours)
+        charging_schedule: Power schedule matrix (vehicles x hours), stored as float32
         n_vehicles: Number of vehicles
         n_hours: Time horizon in hours
         solutions_found: Number of solutions in Pareto front
@@ -51,6 +91,14 @@ class OptimizationResult:
     pareto_front: Optional[np.ndarray] = None  # All Pareto solutions (N x 3: cost, dissatisfaction, peak)
     performance_metrics: Optional[Dict] = None  # Global metrics (Hypervolume, Spacing, etc.)
     
+    # Row/column sums of the schedule, computed on first use
+    _energy_per_vehicle: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _hourly_total: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Store the schedule as contiguous float32 (kW to 2 decimals fit easily)."""
+        self.charging_schedule = np.ascontiguousarray(self.charging_schedule, dtype=np.float32)
+    
     def get_vehicle_schedule(self, vehicle_idx: int) -> np.ndarray:
         """
         Get charging schedule for a specific vehicle.
@@ -70,21 +118,34 @@ class OptimizationResult:
         Get total power consumption per hour.
         
         Returns:
-            Array of hourly totals
+            Array of hourly totals (computed once)
         """
-        return np.sum(self.charging_schedule, axis=0)
+        if self._hourly_total is None:
+            self._compute_sums()
+        return self._hourly_total
     
     def get_energy_per_vehicle(self) -> np.ndarray:
         """
         Calculate total energy delivered to each vehicle.
         
         Returns:
-            Array of energy per vehicle in kWh
+            Array of energy per vehicle in kWh (computed once)
         """
-        return np.sum(self.charging_schedule, axis=1)
+        if self._energy_per_vehicle is None:
+            self._compute_sums()
+        return self._energy_per_vehicle
+    
+    def _compute_sums(self):
+        """Fill both the per-vehicle and the hourly sums with one read of the schedule."""
+        schedule = self.charging_schedule
+        if _schedule_sums is not None and schedule.size >= FUSED_SUMS_MIN_SIZE:
+            self._energy_per_vehicle, self._hourly_total = _schedule_sums(schedule)
+        else:
+            self._energy_per_vehicle, self._hourly_total = _schedule_sums_numpy(schedule)
     
     def to_dict(self) -> dict:
         """Convert result to dictionary."""
+        energy_per_vehicle = self.get_energy_per_vehicle()
         return {
             'metrics': self.metrics.to_dict(),
             'n_vehicles': self.n_vehicles,
@@ -96,8 +157,8 @@ class OptimizationResult:
             'metadata': self.metadata,
             'performance_metrics': self.performance_metrics,
             'summary': {
-                'total_energy': float(np.sum(self.charging_schedule)),
-                'avg_power_per_vehicle': float(np.mean(self.get_energy_per_vehicle())),
+                'total_energy': float(energy_per_vehicle.sum()),
+                'avg_power_per_vehicle': float(energy_per_vehicle.mean()),
                 'peak_hour': int(np.argmax(self.get_hourly_total()))
             }
         }
@@ -106,41 +167,28 @@ class OptimizationResult:
         """Save result to JSON file."""
         data = self.to_dict()
         # Add schedule as list
-        data['charging_schedule'] = self.charging_schedule.tolist()
+        data['charging_schedule'] = self.charging_schedule
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(filepath).write_bytes(dumps_json(data))
     
     def save_schedule_csv(self, filepath: str):
         """Save charging schedule to CSV."""
-        import csv
+        header = ','.join(['Vehicle'] + [f'Hour_{h:02d}' for h in range(self.n_hours)])
         
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            header = ['Vehicle'] + [f'Hour_{h:02d}' for h in range(self.n_hours)]
-            writer.writerow(header)
-            
-            # Data
-            for i in range(self.n_vehicles):
-                row = [f'V{i+1:02d}'] + [f'{p:.2f}' for p in self.charging_schedule[i, :]]
-                writer.writerow(row)
+        # Vehicle label column (V01, V02...) followed by the hourly powers
+        rows = np.column_stack([np.arange(1, self.n_vehicles + 1), self.charging_schedule])
+        np.savetxt(
+            filepath, rows, fmt=['V%02d'] + ['%.2f'] * self.n_hours,
+            delimiter=',', header=header, comments='', newline='\r\n'
+        )
     
     def save_pareto_front_csv(self, filepath: str):
         """Save Pareto front objectives to CSV."""
         if self.pareto_front is None:
             return
         
-        import csv
-        
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow(['solution_id', 'cost', 'dissatisfaction', 'peak_power'])
-            
-            # Data - each solution
-            for i, solution in enumerate(self.pareto_front):
-                row = [i, f'{solution[0]:.2f}', f'{solution[1]:.4f}', f'{solution[2]:.2f}']
-                writer.writerow(row)
+        rows = np.column_stack([np.arange(len(self.pareto_front)), self.pareto_front])
+        np.savetxt(
+            filepath, rows, fmt=['%d', '%.2f', '%.4f', '%.2f'], delimiter=',',
+            header='solution_id,cost,dissatisfaction,peak_power', comments='', newline='\r\n'
+        )
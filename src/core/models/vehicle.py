@@ -1,13 +1,13 @@
 """
 Vehicle domain model representing an electric vehicle in the charging system.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from typing import Optional
 from datetime import datetime
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """
     Represents an electric vehicle with charging requirements.
@@ -22,6 +22,9 @@ class Vehicle:
         user_id: Optional user identifier
         charging_power_min: Minimum charging power (negative for V2G) in kW
         charging_power_max: Maximum charging power in kW
+        validate: Check the parameters on construction (builders that hand
+            the vehicles to a Scenario can skip it: the Scenario checks
+            all vehicles at once on its columns)
     """
     battery_capacity: float
     soc_initial: float
@@ -32,10 +35,19 @@ class Vehicle:
     user_id: Optional[str] = None
     charging_power_min: float = -6.0  # V2G capability
     charging_power_max: float = 30.0
+    validate: InitVar[bool] = True
     
-    def __post_init__(self):
-        """Validate vehicle parameters."""
-        self._validate()
+    # Derived from arrival/departure in __post_init__ (fields are not
+    # expected to change after construction)
+    _is_overnight: bool = field(init=False, repr=False, compare=False)
+    _hours_available: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self, validate: bool):
+        """Validate vehicle parameters and precompute the stay length."""
+        if validate:
+            self._validate()
+        self._is_overnight = self.departure_time <= self.arrival_time
+        self._hours_available = (self.departure_time - self.arrival_time) % 24 or 24
     
     def _validate(self):
         """Validate all vehicle parameters."""
@@ -64,12 +76,11 @@ class Vehicle:
         Returns:
             True if vehicle is present at this hour
         """
-        if self.departure_time > self.arrival_time:
-            # Same day
-            return self.arrival_time <= hour < self.departure_time
-        else:
-            # Overnight stay
-            return hour >= self.arrival_time or hour < self.departure_time
+        if 0 <= hour < 24:
+            # Hours elapsed since arrival, wrapping at midnight: no same-day/overnight branch
+            return (hour - self.arrival_time) % 24 < self._hours_available
+        # Outside the day only an overnight stay is open-ended
+        return self._is_overnight
     
     def energy_needed(self) -> float:
         """
@@ -87,10 +98,7 @@ class Vehicle:
         Returns:
             Number of hours
         """
-        if self.departure_time > self.arrival_time:
-            return self.departure_time - self.arrival_time
-        else:
-            return (24 - self.arrival_time) + self.departure_time
+        return self._hours_available
     
     def minimum_charging_power(self) -> float:
         """
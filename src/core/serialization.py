@@ -0,0 +1,50 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed (C implementation, native NumPy support)
+and falls back to the standard library otherwise.
+"""
+import json
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Convert NumPy values the JSON encoders do not handle natively."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: Data to serialize (dicts, lists, scalars, NumPy arrays/scalars)
+        indent: Pretty-print with a 2-space indent
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+
+    return json.dumps(data, default=_default, indent=2 if indent else None).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize JSON bytes or text."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
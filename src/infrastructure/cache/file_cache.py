@@ -2,31 +2,89 @@
 File-based cache implementation.
 """
 import json
+import os
 import pickle
+import struct
+import time
 from pathlib import Path
 from typing import Optional, Any
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from ...core.interfaces.cache import ICache
+import numpy as np
+
+from ...core.interfaces.cache import ICache, NEVER_EXPIRE
+from ...core.entities.scenario import Scenario
+from ...core.entities.vehicle_array import VehicleArray
 from ...core.exceptions import CacheError
 from ...config.logging_config import get_logger
 
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    PYARROW_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    MSGPACK_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Pickle files with out-of-band buffers: magic, buffer count, then
+# (pickle size, buffer sizes...) as uint64, then the pickle stream and the
+# buffers, each starting at a 64-byte file offset. Files without the magic are
+# plain pickles from older versions.
+PICKLE_MAGIC = b"EVPKL5\0\0"
+PICKLE_ALIGN = 64
+
+# VehicleArray columns stored as Arrow columns (one row per vehicle)
+VEHICLE_COLUMNS = [
+    'id', 'user_id', 'battery_capacity', 'soc_initial', 'soc_target',
+    'arrival_time', 'departure_time', 'charging_power_min', 'charging_power_max'
+]
+
+
+def _pack_ndarray(obj: Any) -> Any:
+    """msgpack hook: store arrays as raw bytes plus dtype and shape."""
+    if isinstance(obj, np.ndarray):
+        return {
+            "__ndarray__": True,
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "data": np.ascontiguousarray(obj).tobytes()
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} cannot be cached with msgpack")
+
+
+def _unpack_ndarray(obj: dict) -> Any:
+    """msgpack hook: rebuild arrays packed by _pack_ndarray (read-only, no copy)."""
+    if obj.get("__ndarray__"):
+        return np.frombuffer(obj["data"], dtype=np.dtype(obj["dtype"])).reshape(obj["shape"])
+    return obj
+
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with metadata."""
     value: Any
     timestamp: datetime
     ttl: Optional[timedelta] = None
+    expires_at: Optional[float] = field(init=False, default=None)  # Unix epoch, None = never
+    
+    def __post_init__(self):
+        """Precompute the expiration time once."""
+        if self.ttl is not None:
+            self.expires_at = self.timestamp.timestamp() + self.ttl.total_seconds()
     
     def is_expired(self) -> bool:
         """Check if entry has expired."""
-        if self.ttl is None:
-            return False
-        return datetime.now() > self.timestamp + self.ttl
+        return self.expires_at is not None and time.time() > self.expires_at
 
 
 class FileCache(ICache):
@@ -36,7 +94,9 @@ class FileCache(ICache):
         self,
         cache_dir: Path,
         default_ttl: Optional[timedelta] = None,
-        use_pickle: bool = False
+        use_pickle: bool = False,
+        use_arrow: bool = False,
+        use_msgpack: bool = False
     ):
         """
         Initialize file cache.
@@ -44,12 +104,25 @@ class FileCache(ICache):
         Args:
             cache_dir: Directory for cache files
             default_ttl: Default time-to-live
-            use_pickle: Use pickle instead of JSON (allows caching any object)
+            use_pickle: Use pickle instead of JSON (allows caching any object;
+                NumPy arrays are stored out of band, protocol 5)
+            use_arrow: Store Scenario objects as columnar Arrow IPC files
+                (takes precedence over the other modes, requires pyarrow)
+            use_msgpack: Store plain data (dicts, lists, scalars, NumPy arrays)
+                as msgpack, arrays as raw bytes (takes precedence over
+                use_pickle, requires msgpack)
         """
+        if use_arrow and not PYARROW_AVAILABLE:
+            raise CacheError("Arrow cache requested but pyarrow is not installed")
+        if use_msgpack and not MSGPACK_AVAILABLE:
+            raise CacheError("msgpack cache requested but msgpack is not installed")
+        
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl
         self.use_pickle = use_pickle
+        self.use_arrow = use_arrow
+        self.use_msgpack = use_msgpack
         
         logger.info(f"Initialized FileCache at {self.cache_dir}")
     
@@ -57,7 +130,14 @@ class FileCache(ICache):
         """Get file path for cache key."""
         # Sanitize key for filesystem
         safe_key = key.replace("/", "_").replace("\\", "_")
-        extension = ".pkl" if self.use_pickle else ".json"
+        if self.use_arrow:
+            extension = ".arrow"
+        elif self.use_msgpack:
+            extension = ".msgpack"
+        elif self.use_pickle:
+            extension = ".pkl"
+        else:
+            extension = ".json"
         return self.cache_dir / f"{safe_key}{extension}"
     
     def get(self, key: str) -> Optional[Any]:
@@ -70,15 +150,23 @@ class FileCache(ICache):
         
         try:
             # Load cache entry
-            if self.use_pickle:
-                with open(cache_path, "rb") as f:
-                    entry = pickle.load(f)
+            if self.use_arrow:
+                entry = self._read_arrow(cache_path)
+            elif self.use_msgpack:
+                entry = self._read_msgpack(cache_path)
+            elif self.use_pickle:
+                entry = self._read_pickle(cache_path)
             else:
                 with open(cache_path, "r") as f:
                     data = json.load(f)
+                    timestamp = data["timestamp"]
                     entry = CacheEntry(
                         value=data["value"],
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
+                        # Epoch seconds (ISO strings from older cache files still accepted)
+                        timestamp=(
+                            datetime.fromtimestamp(timestamp) if isinstance(timestamp, (int, float))
+                            else datetime.fromisoformat(timestamp)
+                        ),
                         ttl=timedelta(seconds=data["ttl"]) if data.get("ttl") else None
                     )
             
@@ -99,7 +187,10 @@ class FileCache(ICache):
         """Store value in cache."""
         cache_path = self._get_cache_path(key)
         
-        ttl = ttl or self.default_ttl
+        if ttl is NEVER_EXPIRE:
+            ttl = None  # Stored without TTL: never expires
+        else:
+            ttl = ttl or self.default_ttl
         
         entry = CacheEntry(
             value=value,
@@ -108,17 +199,19 @@ class FileCache(ICache):
         )
         
         try:
-            if self.use_pickle:
-                with open(cache_path, "wb") as f:
-                    pickle.dump(entry, f)
+            if self.use_arrow:
+                self._write_arrow(cache_path, entry)
+            elif self.use_msgpack:
+                self._write_msgpack(cache_path, entry)
+            elif self.use_pickle:
+                self._write_pickle(cache_path, entry)
             else:
                 data = {
                     "value": value,
-                    "timestamp": entry.timestamp.isoformat(),
+                    "timestamp": entry.timestamp.timestamp(),
                     "ttl": ttl.total_seconds() if ttl else None
                 }
-                with open(cache_path, "w") as f:
-                    json.dump(data, f, indent=2)
+                cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
             
             logger.debug(f"Cached: {key}")
             
@@ -126,6 +219,120 @@ class FileCache(ICache):
             logger.error(f"Cache write error for {key}: {e}")
             raise CacheError(f"Failed to cache {key}: {e}")
     
+    def _write_pickle(self, cache_path: Path, entry: CacheEntry):
+        """
+        Write an entry with pickle protocol 5.
+        
+        Contiguous NumPy arrays are handed out of band and written as is
+        after the pickle stream instead of being copied into it.
+        """
+        buffers = []
+        payload = pickle.dumps(entry, protocol=5, buffer_callback=buffers.append)
+        chunks = [memoryview(payload)] + [buffer.raw() for buffer in buffers]
+        
+        header = PICKLE_MAGIC + struct.pack(
+            f"<Q{len(chunks)}Q", len(buffers), *(chunk.nbytes for chunk in chunks)
+        )
+        with open(cache_path, "wb") as f:
+            f.write(header)
+            offset = len(header)
+            for chunk in chunks:
+                padding = -offset % PICKLE_ALIGN
+                f.write(b"\0" * padding)
+                f.write(chunk)
+                offset += padding + chunk.nbytes
+    
+    def _read_pickle(self, cache_path: Path) -> CacheEntry:
+        """Read an entry written by _write_pickle (or a plain pickle file)."""
+        with open(cache_path, "rb") as f:
+            # Single read into a writable buffer: arrays are rebuilt on top of it without copies
+            data = bytearray(os.fstat(f.fileno()).st_size)
+            f.readinto(data)
+        
+        if not data.startswith(PICKLE_MAGIC):
+            return pickle.loads(data)
+        
+        view = memoryview(data)
+        offset = len(PICKLE_MAGIC)
+        (n_buffers,) = struct.unpack_from("<Q", data, offset)
+        sizes = struct.unpack_from(f"<{n_buffers + 1}Q", data, offset + 8)
+        offset += 8 * (n_buffers + 2)
+        
+        chunks = []
+        for size in sizes:
+            offset += -offset % PICKLE_ALIGN
+            chunks.append(view[offset:offset + size])
+            offset += size
+        
+        return pickle.loads(chunks[0], buffers=chunks[1:])
+    
+    def _write_msgpack(self, cache_path: Path, entry: CacheEntry):
+        """Write an entry as msgpack (NumPy arrays as raw bytes)."""
+        data = {
+            "value": entry.value,
+            "timestamp": entry.timestamp.timestamp(),
+            "ttl": entry.ttl.total_seconds() if entry.ttl else None
+        }
+        cache_path.write_bytes(msgpack.packb(data, default=_pack_ndarray, use_bin_type=True))
+    
+    def _read_msgpack(self, cache_path: Path) -> CacheEntry:
+        """Read an entry written by _write_msgpack."""
+        data = msgpack.unpackb(cache_path.read_bytes(), object_hook=_unpack_ndarray, raw=False)
+        return CacheEntry(
+            value=data["value"],
+            timestamp=datetime.fromtimestamp(data["timestamp"]),
+            ttl=timedelta(seconds=data["ttl"]) if data["ttl"] else None
+        )
+    
+    def _write_arrow(self, cache_path: Path, entry: CacheEntry):
+        """Write a Scenario entry as an Arrow IPC file (vehicles as columns)."""
+        scenario = entry.value
+        if not isinstance(scenario, Scenario):
+            raise CacheError(f"Arrow cache only stores Scenario objects, got {type(scenario).__name__}")
+        
+        # Columns taken as is from the scenario's VehicleArray
+        table = pa.table({name: getattr(scenario.fleet, name) for name in VEHICLE_COLUMNS})
+        table = table.replace_schema_metadata({
+            "timestamp": entry.timestamp.isoformat(),
+            "ttl": json.dumps(entry.ttl.total_seconds() if entry.ttl else None),
+            "scenario": json.dumps({
+                "name": scenario.name,
+                "site_max_power": scenario.site_max_power,
+                "time_horizon": scenario.time_horizon
+            }),
+            # Raw float32 bytes (price_profile is always float32, C-contiguous)
+            "price_profile": scenario.price_profile.tobytes()
+        })
+        
+        with pa.OSFile(str(cache_path), "wb") as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    
+    def _read_arrow(self, cache_path: Path) -> CacheEntry:
+        """Read a Scenario entry written by _write_arrow."""
+        with pa.memory_map(str(cache_path), "r") as source:
+            table = pa_ipc.open_file(source).read_all()
+        
+        metadata = table.schema.metadata
+        info = json.loads(metadata[b"scenario"])
+        ttl = json.loads(metadata[b"ttl"])
+        
+        fleet = VehicleArray(**{name: table.column(name).to_numpy() for name in VEHICLE_COLUMNS})
+        
+        scenario = Scenario(
+            vehicles=fleet.to_vehicles(),
+            price_profile=np.frombuffer(metadata[b"price_profile"], dtype=np.float32),
+            site_max_power=info["site_max_power"],
+            time_horizon=info["time_horizon"],
+            name=info["name"]
+        )
+        
+        return CacheEntry(
+            value=scenario,
+            timestamp=datetime.fromisoformat(metadata[b"timestamp"].decode()),
+            ttl=timedelta(seconds=ttl) if ttl else None
+        )
+    
     def delete(self, key: str):
         """Delete key from cache."""
         cache_path = self._get_cache_path(key)
@@ -136,12 +343,14 @@ class FileCache(ICache):
     
     def clear(self):
         """Clear all cached data."""
-        for cache_file in self.cache_dir.glob("*"):
-            if cache_file.is_file():
-                cache_file.unlink()
+        # DirEntry.is_file uses the type returned by the directory listing: no stat per file
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
         
         logger.info("Cache cleared")
     
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        return self._get_cache_path(key).exists()
+        return os.path.exists(self._get_cache_path(key))
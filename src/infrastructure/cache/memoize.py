@@ -0,0 +1,44 @@
+"""
+In-memory memoization decorator with time-to-live.
+"""
+import functools
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+def memoize(ttl: float, key: Callable[..., Hashable]) -> Callable:
+    """
+    Memoize a function for ``ttl`` seconds.
+
+    Unlike functools.lru_cache the cache key is computed by ``key`` from the
+    call arguments, so functions taking unhashable arguments (repositories,
+    lists...) can still be memoized. Exceptions are not cached.
+
+    Args:
+        ttl: Time-to-live of a cached value in seconds
+        key: Callable receiving the same arguments as the function and
+            returning a hashable cache key
+
+    Returns:
+        Decorator. The wrapped function exposes ``cache_clear()``.
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            now = time.monotonic()
+
+            entry = entries.get(cache_key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+
+            value = func(*args, **kwargs)
+            entries[cache_key] = (now, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
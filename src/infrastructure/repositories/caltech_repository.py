@@ -2,22 +2,110 @@
 Caltech ACN-Data repository implementation.
 """
 import requests
-from typing import List, Optional
-from datetime import date, datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Sequence
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ...core.models.charging_session import ChargingSession
 from ...core.interfaces.data_source import IDataSource
 from ...core.entities.scenario import Scenario
 from ...core.models.vehicle import Vehicle
 from ...core.exceptions import DataSourceError
+from ...core.serialization import loads_json
+from ..cache.memoize import memoize
 from ...config.logging_config import get_logger
 from ...config.settings import settings
 import numpy as np
+import pandas as pd
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    IJSON_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+# Fetched sessions are shared by every repository instance for one hour, so
+# the interactive preview and the use case that follows hit the API once
+SESSIONS_MEMO_TTL = 3600
+
+# Statuses retried by the session adapter (other HTTP errors fail at once)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Concurrent per-day requests in fetch_sessions_range (also the size of the
+# session's connection pool, so every worker keeps its connection alive)
+RANGE_FETCH_WORKERS = 8
+
+# Month numbers of the RFC 1123 abbreviations
+MONTHS = {
+    name: number for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+
+def _parse_rfc1123_value(value: str) -> Optional[datetime]:
+    """Parse one API timestamp as a naive UTC datetime (None if invalid)."""
+    try:
+        if len(value) == 29 and value.endswith(" GMT"):
+            # Fixed offsets: "Mon, 15 Jul 2019 08:00:00 GMT"
+            return datetime(
+                int(value[12:16]), MONTHS[value[8:11]], int(value[5:7]),
+                int(value[17:19]), int(value[20:22]), int(value[23:25])
+            )
+        # Any other RFC 2822 spelling (numeric offset, single-digit day...)
+        parsed = parsedate_to_datetime(value)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+def parse_rfc1123(values: Sequence[str]) -> np.ndarray:
+    """
+    Parse API timestamps ("Mon, 15 Jul 2019 08:00:00 GMT").
+    
+    The fields are read at their fixed offsets, no format string is
+    interpreted per value.
+    
+    Returns:
+        Object array of naive UTC datetimes (None where a value does not parse)
+    """
+    parsed = np.empty(len(values), dtype=object)
+    parsed[:] = [_parse_rfc1123_value(value) for value in values]
+    return parsed
+
+
+# California TOU rates per hour of the day: Off-Peak, Mid-Peak 6-16h, On-Peak 16-22h
+TOU_OFF_PEAK = 0.12
+TOU_DAY_PRICES = np.array(
+    [TOU_OFF_PEAK] * 6 + [0.18] * 10 + [0.30] * 6 + [TOU_OFF_PEAK] * 2,
+    dtype=np.float32
+)
+TOU_DAY_PRICES.flags.writeable = False
+
+
+@lru_cache(maxsize=16)
+def tou_price_profile(time_horizon: int) -> np.ndarray:
+    """
+    TOU (Time of Use) price profile, built once per horizon.
+    
+    Returns:
+        Read-only float32 array shared by every scenario of that horizon
+    """
+    # Hours past the first day stay off-peak
+    prices = np.full(time_horizon, TOU_OFF_PEAK, dtype=np.float32)
+    prices[:24] = TOU_DAY_PRICES[:time_horizon]
+    prices.flags.writeable = False
+    return prices
+
 
 class CaltechRepository(IDataSource):
     """Repository for Caltech ACN-Data API."""
@@ -35,19 +123,58 @@ class CaltechRepository(IDataSource):
         Args:
             api_url: API base URL (defaults to settings)
             api_key: API key (defaults to settings)
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of attempts per request
+            retry_delay: Backoff factor in seconds (delay doubles at each retry)
         """
         self.api_url = api_url or settings.caltech_api_url
         self.api_key = api_key or settings.get_api_key()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
+        # One keep-alive session for every request of this repository
+        # (date probe, stats preview, scenario fetch share the TLS connection);
+        # connection errors and transient statuses are retried by urllib3
+        retry = Retry(
+            total=max_retries - 1,
+            backoff_factor=retry_delay,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False  # Last response goes through raise_for_status
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RANGE_FETCH_WORKERS, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json"
+        })
+        self._site_urls: Dict[str, str] = {}
+        # Local generator for the estimated initial SoC (no global random state)
+        self._rng = np.random.default_rng()
+        
         logger.info(f"Initialized CaltechRepository (url={self.api_url})")
     
+    def _request_error(self, url: str, error: requests.exceptions.RequestException) -> DataSourceError:
+        """
+        Describe a failed request by its actual cause.
+        
+        Connection errors, timeouts and RETRY_STATUSES responses are retried
+        by the session adapter; other errors fail on the first attempt.
+        """
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            if status not in RETRY_STATUSES:
+                return DataSourceError(f"API request to {url} failed with HTTP {status}: {error}")
+            return DataSourceError(
+                f"API request to {url} failed with HTTP {status} after {self.max_retries} attempts: {error}"
+            )
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return DataSourceError(f"API request to {url} failed after {self.max_retries} attempts: {error}")
+        return DataSourceError(f"API request to {url} failed: {error}")
+    
     def _make_request(self, url: str, params: dict) -> dict:
         """
-        Make HTTP request with retry logic.
+        Make HTTP request (retries are handled by the session adapter).
         
         Args:
             url: Request URL
@@ -57,27 +184,49 @@ class CaltechRepository(IDataSource):
             JSON response
             
         Raises:
-            DataSourceError: If request fails after retries
+            DataSourceError: If the request fails (after retries for
+                transient errors)
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Accept": "application/json"
-        }
+        try:
+            logger.debug(f"API request: {url}")
+            response = self._session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            # Decode the raw body (orjson when installed, no intermediate str)
+            return loads_json(response.content)
+            
+        except requests.exceptions.RequestException as e:
+            raise self._request_error(url, e)
+        except ValueError as e:
+            raise DataSourceError(f"Invalid JSON response from {url}: {e}")
+    
+    def _iter_items(self, url: str, params: dict) -> Iterator[dict]:
+        """
+        Stream the records of the "_items" array of a response (requires ijson).
         
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"API request attempt {attempt + 1}/{self.max_retries}: {url}")
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+        Records are decoded one at a time while the body is downloaded, the
+        full body and document are never held in memory.
+        
+        Raises:
+            DataSourceError: If the request or the decoding fails
+        """
+        try:
+            logger.debug(f"API streaming request: {url}")
+            with self._session.get(url, params=params, timeout=30, stream=True) as response:
                 response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-                else:
-                    raise DataSourceError(f"API request failed after {self.max_retries} attempts: {e}")
+                response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+                yield from ijson.items(response.raw, "_items.item", use_float=True)
+            
+        except requests.exceptions.RequestException as e:
+            raise self._request_error(url, e)
+        except ijson.JSONError as e:
+            raise DataSourceError(f"Invalid JSON response from {url}: {e}")
+    
+    def site_url(self, site: str) -> str:
+        """Sessions endpoint URL for a site (built once per site)."""
+        url = self._site_urls.get(site)
+        if url is None:
+            url = self._site_urls[site] = f"{self.api_url}/{site}"
+        return url
     
     def fetch_sessions(
         self,
@@ -93,7 +242,7 @@ class CaltechRepository(IDataSource):
             start_date: Start date
             end_date: End date (defaults to start_date)
             site: Site ID
-            limit: Maximum number of sessions
+            limit: Maximum number of sessions (the first valid ones)
             
         Returns:
             List of charging sessions
@@ -101,8 +250,98 @@ class CaltechRepository(IDataSource):
         if end_date is None:
             end_date = start_date
         
+        # The whole period is always fetched (and memoized) and the limit
+        # applied after parsing, so a limited request returns the same
+        # sessions whether or not the period was already fetched
+        sessions = self._fetch_period(site, start_date, end_date)
+        return sessions[:limit] if limit else list(sessions)
+    
+    def fetch_sessions_range(
+        self,
+        start_date: date,
+        end_date: date,
+        site: str = "caltech",
+        limit: Optional[int] = None,
+        workers: int = RANGE_FETCH_WORKERS
+    ) -> List[ChargingSession]:
+        """
+        Fetch the sessions of a date range with one concurrent request per day.
+        
+        Args:
+            start_date: First day
+            end_date: Last day (inclusive)
+            site: Site ID
+            limit: Maximum number of sessions (earliest days first)
+            workers: Maximum number of requests in flight
+            
+        Returns:
+            List of charging sessions, in day order
+        """
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if len(days) <= 1:
+            return self.fetch_sessions(start_date, end_date, site=site, limit=limit)
+        
+        # Requests share the keep-alive connections of self._session
+        with ThreadPoolExecutor(max_workers=min(workers, len(days))) as executor:
+            per_day = list(executor.map(lambda day: self._fetch_period(site, day, day), days))
+        
+        sessions = [session for day_sessions in per_day for session in day_sessions]
+        return sessions[:limit] if limit else sessions
+    
+    def fetch_sessions_arrays(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        site: str = "caltech",
+        limit: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fetch charging sessions as columns, without building session objects.
+        
+        Args:
+            start_date: Start date
+            end_date: End date (defaults to start_date)
+            site: Site ID
+            limit: Maximum number of sessions (the first valid ones, as in
+                fetch_sessions)
+            
+        Returns:
+            Session columns (see ChargingSession.columns), ready for
+            build_scenario_from_arrays
+        """
+        if end_date is None:
+            end_date = start_date
+        
+        columns = self._parse_session_columns(self._fetch_items(site, start_date, end_date))
+        logger.info(f"Successfully fetched {len(columns['kwh_delivered'])} valid sessions")
+        if limit:
+            columns = {name: column[:limit] for name, column in columns.items()}
+        return columns
+    
+    @memoize(
+        ttl=SESSIONS_MEMO_TTL,
+        key=lambda self, site, start_date, end_date: (self.api_url, site, start_date, end_date)
+    )
+    def _fetch_period(
+        self,
+        site: str,
+        start_date: date,
+        end_date: date
+    ) -> List[ChargingSession]:
+        """Fetch and parse all the sessions of a period (memoized)."""
+        sessions = self._parse_sessions(self._fetch_items(site, start_date, end_date))
+        logger.info(f"Successfully fetched {len(sessions)} valid sessions")
+        return sessions
+    
+    def _fetch_items(
+        self,
+        site: str,
+        start_date: date,
+        end_date: date
+    ) -> List[dict]:
+        """Request all the raw session records of a period."""
         # Build API URL
-        url = f"{self.api_url}/{site}"
+        url = self.site_url(site)
         
         # Build query parameters
         params = {}
@@ -117,51 +356,70 @@ class CaltechRepository(IDataSource):
         )
         params["where"] = where_clause
         
-        if limit:
-            params["max_results"] = limit
-        
         logger.info(f"Fetching sessions from {site} ({start_date} to {end_date})")
         
-        # Make request
-        data = self._make_request(url, params)
-        sessions_data = data.get("_items", [])
+        # Make request (records streamed when ijson is installed)
+        if IJSON_AVAILABLE:
+            return list(self._iter_items(url, params))
+        return self._make_request(url, params).get("_items", [])
+    
+    def _parse_session_columns(self, items: List[dict]) -> Dict[str, np.ndarray]:
+        """
+        Parse the session records of an API response into columns.
         
-        #Parse sessions
-        sessions = []
-        for item in sessions_data:
-            try:
-                session = self._parse_session(item)
-                if session:
-                    sessions.append(session)
-            except Exception as e:
-                logger.warning(f"Failed to parse session: {e}")
-                continue
+        Timestamps and energies are converted column-wise; records with a
+        missing field, an unparsable timestamp, no energy delivered or a
+        disconnection before the connection are dropped.
         
-        logger.info(f"Successfully fetched {len(sessions)} valid sessions")
-        return sessions
-    
-    def _parse_session(self, data: dict) -> Optional[ChargingSession]:
-        """Parse session data from API response."""
-        required_fields = ["connectionTime", "disconnectTime", "kWhDelivered", "userID"]
+        Returns:
+            Session columns (see ChargingSession.columns) plus 'session_id'
+            and 'site_name' (object)
+        """
+        required_fields = ("connectionTime", "disconnectTime", "kWhDelivered", "userID")
+        items = [item for item in items if all(field in item for field in required_fields)]
         
-        if not all(field in data for field in required_fields):
-            return None
+        conn_times = parse_rfc1123([item["connectionTime"] for item in items])
+        disconn_times = parse_rfc1123([item["disconnectTime"] for item in items])
+        kwh = pd.to_numeric(pd.Series([item["kWhDelivered"] for item in items], dtype=object), errors="coerce").to_numpy(float)
         
-        if data["kWhDelivered"] <= 0:
-            return None
+        # None (unparsable) becomes NaT, which fails every comparison
+        connection = conn_times.astype('datetime64[s]')
+        disconnection = disconn_times.astype('datetime64[s]')
+        valid = (kwh > 0) & (disconnection > connection)
+        if not valid.all():
+            logger.debug(f"Dropped {int((~valid).sum())} sessions with missing or inconsistent data")
         
-        # Parse timestamps (RFC 1123 format)
-        conn_time = datetime.strptime(data["connectionTime"], "%a, %d %b %Y %H:%M:%S %Z")
-        disconn_time = datetime.strptime(data["disconnectTime"], "%a, %d %b %Y %H:%M:%S %Z")
+        kept = [items[i] for i in np.flatnonzero(valid)]
+        user_id = np.empty(len(kept), dtype=object)
+        user_id[:] = [item["userID"] for item in kept]
+        columns = ChargingSession.columns(kwh[valid], connection[valid], disconnection[valid], user_id)
+        columns['session_id'] = np.array([item.get("_id", "unknown") for item in kept], dtype=object)
+        columns['site_name'] = np.array([item.get("siteName", "unknown") for item in kept], dtype=object)
+        return columns
+    
+    def _parse_sessions(self, items: List[dict]) -> List[ChargingSession]:
+        """
+        Parse the session records of an API response into session objects.
         
-        return ChargingSession(
-            session_id=data.get("_id", "unknown"),
-            user_id=data["userID"],
-            connection_time=conn_time,
-            disconnection_time=disconn_time,
-            kwh_delivered=data["kWhDelivered"],
-            site_name=data.get("siteName", "unknown")
-        )
+        API timestamps have a one-second resolution, so the datetime64[s]
+        columns convert back to the exact datetimes.
+        """
+        columns = self._parse_session_columns(items)
+        return [
+            ChargingSession(
+                session_id=session_id,
+                user_id=user_id,
+                connection_time=connection_time,
+                disconnection_time=disconnection_time,
+                kwh_delivered=kwh_delivered,
+                site_name=site_name
+            )
+            for session_id, user_id, connection_time, disconnection_time, kwh_delivered, site_name in zip(
+                columns['session_id'].tolist(), columns['user_id'].tolist(),
+                columns['connection_time'].tolist(), columns['disconnection_time'].tolist(),
+                columns['kwh_delivered'].tolist(), columns['site_name'].tolist()
+            )
+        ]
     
     def build_scenario(
         self,
@@ -185,61 +443,80 @@ class CaltechRepository(IDataSource):
         
         logger.info(f"Building scenario from {len(sessions)} sessions")
         
-        # Convert sessions to vehicles
+        return self.build_scenario_from_arrays(
+            ChargingSession.batch_to_arrays(sessions), site_max_power, time_horizon
+        )
+    
+    def build_scenario_from_arrays(
+        self,
+        arrays: Dict[str, np.ndarray],
+        site_max_power: float,
+        time_horizon: int = 24
+    ) -> Scenario:
+        """
+        Build optimization scenario from session columns.
+        
+        Args:
+            arrays: Session columns (fetch_sessions_arrays or
+                ChargingSession.batch_to_arrays)
+            site_max_power: Maximum site power
+            time_horizon: Planning horizon
+            
+        Returns:
+            Complete scenario
+        """
+        if len(arrays['kwh_delivered']) == 0:
+            raise DataSourceError("Cannot build scenario from empty sessions list")
+        
+        # Convert sessions to vehicles (estimates computed column-wise)
+        columns = self._sessions_to_vehicle_columns(arrays)
         vehicles = []
-        for session in sessions:
+        for row in zip(*columns.values()):
             try:
-                vehicle = self._session_to_vehicle(session)
-                vehicles.append(vehicle)
+                vehicles.append(Vehicle(
+                    **dict(zip(columns, row)),
+                    charging_power_min=settings.charging_power_min,
+                    charging_power_max=settings.charging_power_max
+                ))
             except Exception as e:
                 logger.warning(f"Failed to convert session to vehicle: {e}")
                 continue
         
         # Generate price profile (TOU tariff)
-        price_profile = self._generate_price_profile(time_horizon)
+        price_profile = tou_price_profile(time_horizon)
         
         scenario = Scenario(
             vehicles=vehicles,
             price_profile=price_profile,
             site_max_power=site_max_power,
             time_horizon=time_horizon,
-            name=f"caltech_{sessions[0].connection_time.date()}"
+            name=f"caltech_{arrays['connection_time'][0].astype('datetime64[D]')}"
         )
         
         logger.info(f"Built scenario with {len(vehicles)} vehicles")
         return scenario
     
-    def _session_to_vehicle(self, session: ChargingSession) -> Vehicle:
-        """Convert charging session to vehicle."""
-        #Estimate SoC (we don't have real SoC data)
-        battery_capacity = settings.battery_capacity
-        soc_initial = np.random.uniform(0.1, 0.4)  # Assume arrives with low battery
-        energy_delivered = session.kwh_delivered
-        soc_gained = energy_delivered / battery_capacity
-        soc_target = min(soc_initial + soc_gained, 1.0)
-        
-        return Vehicle(
-            battery_capacity=battery_capacity,
-            soc_initial=soc_initial,
-            soc_target=soc_target,
-            arrival_time=session.arrival_hour(),
-            departure_time=session.departure_hour(),
-            user_id=session.user_id,
-            charging_power_min=settings.charging_power_min,
-            charging_power_max=settings.charging_power_max
-        )
-    
-    def _generate_price_profile(self, time_horizon: int) -> np.ndarray:
-        """Generate TOU (Time of Use) price profile."""
-        hours = np.arange(time_horizon)
+    def _sessions_to_vehicle_columns(self, arrays: Dict[str, np.ndarray]) -> dict:
+        """
+        Vehicle fields for all sessions, computed on arrays.
         
-        # California TOU rates
-        prices = np.where(
-            (hours >= 16) & (hours < 22), 0.30,  # On-Peak
-            np.where(
-                (hours >= 6) & (hours < 16), 0.18,  # Mid-Peak
-                0.12  # Off-Peak
-            )
-        )
+        There is no real SoC data: vehicles are assumed to arrive with a low
+        battery (random initial SoC) and the delivered energy gives the target.
+        
+        Returns:
+            Dictionary of Python lists keyed by Vehicle field name
+        """
+        n = len(arrays['kwh_delivered'])
         
-        return prices
+        battery_capacity = settings.battery_capacity
+        soc_initial = self._rng.uniform(0.1, 0.4, size=n)  # Assume arrives with low battery
+        soc_target = np.minimum(soc_initial + arrays['kwh_delivered'] / battery_capacity, 1.0)
+        
+        return {
+            'battery_capacity': [battery_capacity] * n,
+            'soc_initial': soc_initial.tolist(),
+            'soc_target': soc_target.tolist(),
+            'arrival_time': arrays['arrival_hour'].tolist(),
+            'departure_time': arrays['departure_hour'].tolist(),
+            'user_id': arrays['user_id'].tolist()
+        }
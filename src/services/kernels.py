@@ -0,0 +1,149 @@
+"""
+Numba-compiled fitness kernels for the EV charging problem.
+
+Numba is optional: when it is not installed ``NUMBA_AVAILABLE`` is False and
+callers fall back to the vectorized NumPy implementation.
+
+``evaluate_population`` is compiled eagerly for the exact float32 /
+C-contiguous layout used by ``EVChargingProblem`` and cached on disk, so
+only the very first import pays the compilation (the Docker image does it
+at build time).
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def evaluate_kernel(
+        x_mat, mask, dt_over_cap, soc_initial, soc_target, dep_idx,
+        price_dt, site_max_power, total_power, out_f, out_g
+    ):
+        """
+        Evaluate one individual in a single fused pass.
+
+        Args:
+            x_mat: Power schedule (vehicles x hours)
+            mask: Availability mask (vehicles x hours)
+            dt_over_cap: Time step divided by battery capacity, per vehicle
+            soc_initial: Initial SoC per vehicle
+            soc_target: Target SoC per vehicle
+            dep_idx: Departure hour index per vehicle (clipped to horizon)
+            price_dt: Price profile multiplied by the time step
+            site_max_power: Site power limit in kW
+            total_power: Scratch buffer of length hours
+            out_f: Output objectives (cost, dissatisfaction, peak)
+            out_g: Output constraints (SoC violation, power violation)
+        """
+        n_vehicles, t_horizon = x_mat.shape
+
+        for t in range(t_horizon):
+            total_power[t] = 0.0
+
+        # Pass 1: SoC trajectory, violations and aggregated power
+        dissatisfaction = 0.0
+        soc_violation = 0.0
+        for i in range(n_vehicles):
+            soc = soc_initial[i]
+            final_soc = soc
+            for t in range(t_horizon):
+                p = x_mat[i, t] * mask[i, t]
+                soc += p * dt_over_cap[i]
+                # Branchless distance to [0, 1] (compiles to min/max)
+                soc_violation += abs(soc - min(max(soc, 0.0), 1.0))
+                total_power[t] += p
+                if t == dep_idx[i]:
+                    final_soc = soc
+            if soc_target[i] > final_soc:
+                dissatisfaction += soc_target[i] - final_soc
+
+        # Pass 2: cost and peak over the aggregated profile
+        cost = 0.0
+        peak = 0.0
+        for t in range(t_horizon):
+            cost += total_power[t] * price_dt[t]
+            abs_power = abs(total_power[t])
+            if abs_power > peak:
+                peak = abs_power
+
+        out_f[0] = cost
+        out_f[1] = dissatisfaction
+        out_f[2] = peak
+        out_g[0] = soc_violation
+        out_g[1] = max(0.0, peak - site_max_power)
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def availability_kernel(arrival, departure, out):
+        """
+        Write the availability mask (vehicles x hours) into a preallocated array.
+
+        Same rule as Vehicle.available_at. Indexed loops over C-contiguous
+        rows, no temporaries; out may be of any numeric dtype (1.0 = present).
+        """
+        n_vehicles, t_horizon = out.shape
+        for i in range(n_vehicles):
+            a = arrival[i]
+            d = departure[i]
+            if d > a:
+                # Same day
+                for h in range(t_horizon):
+                    out[i, h] = (h >= a) & (h < d)
+            else:
+                # Overnight stay
+                for h in range(t_horizon):
+                    out[i, h] = (h >= a) | (h < d)
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def nearest_neighbor_kernel(points, out):
+        """
+        Euclidean distance from each point (row) to its nearest other point.
+
+        O(N^2) time but O(N) memory: no pairwise matrix is materialized.
+        Rows are spread over worker threads. No fastmath here: the running
+        minimum starts at +inf.
+        """
+        n_points, n_dims = points.shape
+        for i in prange(n_points):
+            best = np.inf
+            for j in range(n_points):
+                if j == i:
+                    continue
+                d2 = 0.0
+                for k in range(n_dims):
+                    diff = points[i, k] - points[j, k]
+                    d2 += diff * diff
+                if d2 < best:
+                    best = d2
+            out[i] = np.sqrt(best)
+
+    # X, mask, dt_over_cap, soc_initial, soc_target, dep_idx,
+    # price_dt, site_max_power, total_power, F, G
+    POPULATION_SIGNATURE = (
+        "void(f4[:, :, ::1], f4[:, ::1], f4[::1], f4[::1], f4[::1], intp[::1], "
+        "f4[::1], f8, f4[:, ::1], f8[:, ::1], f8[:, ::1])"
+    )
+
+    @njit(POPULATION_SIGNATURE, parallel=True, cache=True, fastmath=True, boundscheck=False)
+    def evaluate_population(
+        X, mask, dt_over_cap, soc_initial, soc_target, dep_idx,
+        price_dt, site_max_power, total_power, F, G
+    ):
+        """
+        Evaluate a population tensor (pop x vehicles x hours) into F and G.
+
+        Individuals are independent, so they are spread over worker threads.
+        F (pop x 3), G (pop x 2) and the total_power scratch (pop x hours)
+        must be allocated by the caller so the parallel region never allocates.
+        All arrays must be C-contiguous with the dtypes of POPULATION_SIGNATURE.
+        """
+        for k in prange(X.shape[0]):
+            evaluate_kernel(
+                X[k], mask, dt_over_cap, soc_initial, soc_target, dep_idx,
+                price_dt, site_max_power, total_power[k], F[k], G[k]
+            )
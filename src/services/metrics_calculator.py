@@ -1,13 +1,33 @@
 """
 Performance metrics calculator for multi-objective optimization.
 """
+import copy
+import hashlib
+from collections import OrderedDict
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Hashable, Optional
 from pymoo.indicators.hv import HV
 from ..config.logging_config import get_logger
+from . import kernels
 
 logger = get_logger(__name__)
 
+# Rows of the pairwise distance matrix computed at once in _spacing
+SPACING_BLOCK_SIZE = 1024
+
+# From this many points _spacing uses the compiled nearest-neighbour kernel
+# (when Numba is installed) instead of the blocked distance matrix
+SPACING_KERNEL_MIN_SIZE = 4096
+
+# From this many points the hypervolume is computed on a float32 copy of the
+# front; smaller fronts (the usual MODE population) stay exact in float64
+HV_FLOAT32_MIN_SIZE = 1000
+
+# Metrics of the most recent fronts, keyed on the calculator settings and
+# a digest of the front bytes (shared by all calculators, LRU eviction)
+RESULTS_CACHE_SIZE = 64
+_results_cache: "OrderedDict[Hashable, Dict]" = OrderedDict()
+
 
 class MetricsCalculator:
     """Calculate performance metrics for multi-objective optimization."""
@@ -26,19 +46,33 @@ class MetricsCalculator:
         self.reference_point = reference_point  # Can be None, will compute dynamically if needed
         logger.debug(f"Initialized MetricsCalculator with ref_point={self.reference_point}")
 
-    def _spacing(self, pareto_front: np.ndarray) -> float:
-        """Calculate spacing metric manually."""
+    def _spacing(self, pareto_front: np.ndarray, block_size: int = SPACING_BLOCK_SIZE) -> float:
+        """
+        Calculate spacing metric manually.
+
+        Nearest-neighbour distances come from the pairwise squared distances
+        ``|a|^2 + |b|^2 - 2 a.b`` (one matrix product per block of rows), so
+        at most block_size x N distances are held in memory. Large fronts
+        go through the compiled kernel (O(N) memory) when Numba is installed.
+        """
         N = len(pareto_front)
         if N <= 1:
             return 0.0
-        distances = []
-        for i in range(N):
-            others = np.delete(pareto_front, i, axis=0)
-            d = np.min(np.linalg.norm(others - pareto_front[i], axis=1))
-            distances.append(d)
-        distances = np.array(distances)
-        s = np.sqrt(np.mean((distances - np.mean(distances)) ** 2))
-        return s
+        if kernels.NUMBA_AVAILABLE and N >= SPACING_KERNEL_MIN_SIZE:
+            distances = np.empty(N)
+            kernels.nearest_neighbor_kernel(np.ascontiguousarray(pareto_front, dtype=float), distances)
+            return float(distances.std())
+        pf = np.asarray(pareto_front, dtype=float)  # Any layout: einsum/matmul take strides
+        sq_norms = np.einsum('ij,ij->i', pf, pf)
+        distances = np.empty(N)
+        for start in range(0, N, block_size):
+            stop = min(start + block_size, N)
+            d2 = sq_norms[start:stop, None] + sq_norms[None, :] - 2.0 * (pf[start:stop] @ pf.T)
+            d2[np.arange(stop - start), np.arange(start, stop)] = np.inf  # Exclude the point itself
+            distances[start:stop] = d2.min(axis=1)
+        # Rounding can leave tiny negative squares for duplicate points
+        distances = np.sqrt(np.maximum(distances, 0.0))
+        return float(distances.std())
 
     def _compute_reference_point(self, pareto_front: np.ndarray) -> np.ndarray:
         """Compute a safe reference point above the Pareto front maxima."""
@@ -51,9 +85,10 @@ class MetricsCalculator:
         """Normalize Pareto front to [0,1] for each objective."""
         min_vals = np.min(pareto_front, axis=0)
         max_vals = np.max(pareto_front, axis=0)
-        range_vals = max_vals - min_vals
-        range_vals[range_vals == 0] = 1.0  # éviter division par zéro
-        normalized_pf = (pareto_front - min_vals) / range_vals
+        range_vals = np.where(max_vals > min_vals, max_vals - min_vals, 1.0)  # éviter division par zéro
+        # One front-sized allocation: the division happens in place
+        normalized_pf = np.subtract(pareto_front, min_vals, dtype=float)
+        np.divide(normalized_pf, range_vals, out=normalized_pf)
         logger.debug(f"Normalized Pareto front with min {min_vals} and max {max_vals}")
         return normalized_pf
 
@@ -63,6 +98,32 @@ class MetricsCalculator:
             logger.warning("Empty Pareto front, cannot calculate metrics")
             return {}
 
+        # Column-major: each objective is a contiguous column for the reductions below
+        pareto_front = np.asfortranarray(pareto_front, dtype=float)
+
+        # Unchanged front: reuse the metrics computed last time
+        key = self._cache_key(pareto_front)
+        metrics = _results_cache.get(key)
+        if metrics is None:
+            metrics = self._calculate(pareto_front)
+            _results_cache[key] = metrics
+            if len(_results_cache) > RESULTS_CACHE_SIZE:
+                _results_cache.popitem(last=False)
+        else:
+            _results_cache.move_to_end(key)
+            logger.debug("Metrics cache hit")
+
+        # Callers get their own copy of the nested dicts
+        return copy.deepcopy(metrics)
+
+    def _cache_key(self, pareto_front: np.ndarray) -> Hashable:
+        """Cache key of a front for this calculator's settings (content digest, no collisions in practice)."""
+        digest = hashlib.blake2b(pareto_front.tobytes(order='A'), digest_size=16).digest()
+        reference_point = None if self.reference_point is None else tuple(np.asarray(self.reference_point, dtype=float).tolist())
+        return (self.normalize, self.margin, reference_point, pareto_front.shape, digest)
+
+    def _calculate(self, pareto_front: np.ndarray) -> Dict[str, float]:
+        """Calculate all performance metrics of a non-empty float64 front."""
         metrics = {}
 
         # Normalisation si activée
@@ -76,7 +137,10 @@ class MetricsCalculator:
                 ref_point = self.reference_point
 
             hv_indicator = HV(ref_point=ref_point)
-            metrics['hypervolume'] = float(hv_indicator(pf_for_metrics))
+            # Large fronts go through HV in float32 (half the bytes; relative
+            # error ~1e-7, well below what front comparisons need)
+            hv_input = pf_for_metrics.astype(np.float32) if len(pf_for_metrics) >= HV_FLOAT32_MIN_SIZE else pf_for_metrics
+            metrics['hypervolume'] = float(hv_indicator(hv_input))
             metrics['reference_point'] = ref_point.tolist()
             logger.debug(f"Hypervolume: {metrics['hypervolume']:.4f}")
         except Exception as e:
@@ -95,33 +159,17 @@ class MetricsCalculator:
         # Nombre de solutions
         metrics['n_solutions'] = len(pareto_front)
 
-        # Best objectives
-        metrics['best_objectives'] = {
-            'cost': float(np.min(pareto_front[:, 0])),
-            'dissatisfaction': float(np.min(pareto_front[:, 1])),
-            'peak_power': float(np.min(pareto_front[:, 2]))
-        }
-
-        # Worst objectives
-        metrics['worst_objectives'] = {
-            'cost': float(np.max(pareto_front[:, 0])),
-            'dissatisfaction': float(np.max(pareto_front[:, 1])),
-            'peak_power': float(np.max(pareto_front[:, 2]))
-        }
-
-        # Mean objectives
-        metrics['mean_objectives'] = {
-            'cost': float(np.mean(pareto_front[:, 0])),
-            'dissatisfaction': float(np.mean(pareto_front[:, 1])),
-            'peak_power': float(np.mean(pareto_front[:, 2]))
-        }
-
-        # Std objectives
-        metrics['std_objectives'] = {
-            'cost': float(np.std(pareto_front[:, 0])),
-            'dissatisfaction': float(np.std(pareto_front[:, 1])),
-            'peak_power': float(np.std(pareto_front[:, 2]))
-        }
+        # Per-objective statistics, one reduction per statistic over all columns
+        min_vals = pareto_front.min(axis=0)
+        max_vals = pareto_front.max(axis=0)
+        mean_vals = pareto_front.mean(axis=0)
+        std_vals = pareto_front.std(axis=0)
+        names = ('cost', 'dissatisfaction', 'peak_power')
+
+        metrics['best_objectives'] = dict(zip(names, min_vals.tolist()))
+        metrics['worst_objectives'] = dict(zip(names, max_vals.tolist()))
+        metrics['mean_objectives'] = dict(zip(names, mean_vals.tolist()))
+        metrics['std_objectives'] = dict(zip(names, std_vals.tolist()))
 
         return metrics
 
@@ -4,7 +4,9 @@ MODE Optimization Service implementing IOptimizer.
 import numpy as np
 from typing import Optional, Dict, Any
 from time import time
-from pymoo.core.problem import ElementwiseProblem
+from pymoo.core.problem import Problem
+from pymoo.core.sampling import Sampling
+from pymoo.termination.default import DefaultMultiObjectiveTermination
 from pymoode.algorithms import MODE
 from pymoo.optimize import minimize
 from pymoo.config import Config
@@ -16,6 +18,13 @@ from ..core.exceptions import OptimizationError
 from ..config.logging_config import get_logger
 from ..config.settings import settings
 from .metrics_calculator import MetricsCalculator
+from . import kernels
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    CUPY_AVAILABLE = False
 
 # Disable pymoo compilation warnings
 Config.warnings['not_compiled'] = False
@@ -23,10 +32,13 @@ Config.warnings['not_compiled'] = False
 logger = get_logger(__name__)
 
 
-class EVChargingProblem(ElementwiseProblem):
+class EVChargingProblem(Problem):
     """
     Multi-objective optimization problem for EV charging.
     
+    The problem is vectorized: pymoo passes the whole population at once
+    and every objective/constraint is computed as a batched array operation.
+    
     Objectives:
         1. Minimize cost (electricity cost)
         2. Minimize dissatisfaction (unmet charging needs)
@@ -35,110 +47,319 @@ class EVChargingProblem(ElementwiseProblem):
     Constraints:
         1. Battery SoC must stay between 0% and 100%
         2. Site total power must not exceed maximum
+    
+    With a positive penalty_weight the constraints are folded into every
+    objective as a weighted violation penalty instead of being handed to
+    pymoo, which then skips its feasibility bookkeeping.
+    
+    With device="cuda" the population is evaluated on the GPU with CuPy
+    (same batched operations as the NumPy path); worth it for large
+    scenarios, roughly pop_size x vehicles x hours above 10^6.
     """
     
-    def __init__(self, scenario: Scenario):
+    # Working precision of the fitness evaluation
+    DTYPE = np.float32
+    
+    def __init__(
+        self,
+        scenario: Scenario,
+        use_numba: Optional[bool] = None,
+        penalty_weight: float = 0.0,
+        device: str = "cpu"
+    ):
         """
         Initialize optimization problem.
         
         Args:
             scenario: Charging scenario
+            use_numba: Use the compiled fitness kernel (defaults to True when Numba is installed)
+            penalty_weight: Fold constraint violations into the objectives with
+                this weight (0 keeps explicit constraints)
+            device: Evaluation device, "cpu" or "cuda" (requires CuPy)
         """
         self.scenario = scenario
+        if device not in ("cpu", "cuda"):
+            raise OptimizationError(f"device must be 'cpu' or 'cuda', got {device!r}")
+        if device == "cuda" and not CUPY_AVAILABLE:
+            raise OptimizationError("CUDA evaluation requested but cupy is not installed")
+        if device == "cuda" and use_numba:
+            raise OptimizationError("The Numba kernel runs on the CPU, it cannot be combined with device='cuda'")
+        self.device = device
+        self.use_numba = (kernels.NUMBA_AVAILABLE and device == "cpu") if use_numba is None else use_numba
+        if self.use_numba and not kernels.NUMBA_AVAILABLE:
+            raise OptimizationError("Numba kernel requested but numba is not installed")
+        if penalty_weight < 0:
+            raise OptimizationError(f"penalty_weight must be non-negative, got {penalty_weight}")
+        self.penalty_weight = float(penalty_weight)
         n_vars = len(scenario.vehicles) * scenario.time_horizon
         
-        # Power bounds
-        xl = settings.charging_power_min
-        xu = settings.charging_power_max
+        # Per-variable power bounds: slots where the vehicle is absent are
+        # pinned to 0 (xl == xu), so DE does not spend effort on them
+        available = scenario.get_availability_mask().reshape(-1)
+        xl = np.where(available, settings.charging_power_min, 0.0)
+        xu = np.where(available, settings.charging_power_max, 0.0)
         
         super().__init__(
             n_var=n_vars,
             n_obj=3,  # cost, dissatisfaction, peak
-            n_ieq_constr=2,  # SoC bounds, site power
+            n_ieq_constr=0 if self.penalty_weight else 2,  # SoC bounds, site power
             xl=xl,
             xu=xu
         )
         
+        # Scenario invariants, computed once instead of on every evaluation.
+        # Stored as float32: powers, prices and SoCs have ample headroom and
+        # the evaluation is memory-bound, so halving the bytes pays directly.
+        dtype = self.DTYPE
+        self._n_vehicles = len(scenario.vehicles)
+        self._t_horizon = scenario.time_horizon
+        self._dt_over_cap = (settings.dt / scenario.get_battery_capacities()).astype(dtype)
+        self._soc_initial = scenario.get_initial_soc_vector().astype(dtype)
+        self._soc_target = scenario.get_target_soc_vector().astype(dtype)
+        self._price_dt = (np.asarray(scenario.price_profile) * settings.dt).astype(dtype)
+        self._site_max_power = float(scenario.site_max_power)
+        
+        # Availability mask, plain and scaled by dt / capacity for SoC increments
+        # (the compiled kernel writes the float mask directly, no bool temporaries)
+        if self.use_numba:
+            self._mask = np.empty((self._n_vehicles, self._t_horizon), dtype=dtype)
+            kernels.availability_kernel(scenario.arrival, scenario.departure, self._mask)
+        else:
+            self._mask = np.ascontiguousarray(scenario.get_availability_mask(), dtype=dtype)
+        self._scaled_mask = np.ascontiguousarray(self._mask * self._dt_over_cap[:, np.newaxis])
+        
+        # Scratch buffers reused across generations (sized on first evaluation,
+        # the population size is fixed for the whole run)
+        self._x_buf = None
+        self._soc_buf = None
+        self._total_power_buf = None
+        
+        # Gather indices for the SoC at departure (constant for the scenario)
+        self._row_idx = np.arange(self._n_vehicles)
+        self._dep_idx = np.clip(
+            scenario.get_departure_times(), 0, scenario.time_horizon - 1
+        ).astype(np.intp)
+        
+        # Device copies of the invariants (uploaded on the first CUDA evaluation)
+        self._gpu = None
+        
         logger.debug(f"Initialized problem with {n_vars} variables")
     
+    def heuristic_schedule(self) -> np.ndarray:
+        """
+        Greedy feasible schedule: vehicles (earliest departure first) charge at
+        their cheapest available hours before departure until the target SoC
+        is reached, without exceeding the remaining site capacity.
+        
+        Returns:
+            Power matrix (vehicles x hours)
+        """
+        schedule = np.zeros((self._n_vehicles, self._t_horizon))
+        site_load = np.zeros(self._t_horizon)
+        p_max = settings.charging_power_max
+        # Small slack so float32 rounding cannot push the sum over the limit
+        site_cap = self._site_max_power * (1.0 - 1e-6)
+        hours = np.arange(self._t_horizon)
+        
+        for i in np.argsort(self._dep_idx, kind="stable"):
+            # Only hours up to departure count towards the departure SoC
+            window = (self._mask[i] > 0) & (hours <= self._dep_idx[i])
+            if not window.any():
+                window = self._mask[i] > 0
+            
+            remaining = max(0.0, float(self._soc_target[i] - self._soc_initial[i]))
+            soc_per_kw = float(self._dt_over_cap[i])
+            candidates = hours[window]
+            for t in candidates[np.argsort(self._price_dt[window], kind="stable")]:
+                if remaining <= 0:
+                    break
+                power = min(p_max, remaining / soc_per_kw, site_cap - site_load[t])
+                if power <= 0:
+                    continue
+                schedule[i, t] = power
+                site_load[t] += power
+                remaining -= power * soc_per_kw
+        
+        return schedule
+    
     def _evaluate(self, x, out, *args, **kwargs):
-        """Evaluate objectives and constraints for solution x."""
-        # Reshape to matrix (vehicles x hours)
-        n_vehicles = len(self.scenario.vehicles)
-        t_horizon = self.scenario.time_horizon
-        power_matrix = x.reshape((n_vehicles, t_horizon))
+        """Evaluate objectives and constraints for the whole population x."""
+        # Copy into a reused tensor (population x vehicles x hours), float32 and
+        # C-contiguous with hours as the fastest axis so the cumsum /
+        # per-vehicle loops walk contiguous memory
+        shape = (x.shape[0], self._n_vehicles, self._t_horizon)
+        if self.device == "cuda":
+            self._evaluate_cupy(x.reshape(shape), out)
+            if self.penalty_weight:
+                self._fold_penalty(out)
+            return
         
-        # Apply availability mask
-        mask = self.scenario.get_availability_mask()
-        power_matrix = power_matrix * mask
+        self._ensure_buffers(shape)
+        x_tensor = self._x_buf
+        # Copy through a 2-D view of the buffer: a non-contiguous x is gathered
+        # and cast in the same pass, without a float64 reshape temporary
+        np.copyto(x_tensor.reshape(x.shape), x, casting="same_kind")
         
-        # Calculate SoC trajectory
-        soc_profiles = self._calculate_soc_profiles(power_matrix)
+        if self.use_numba:
+            self._evaluate_numba(x_tensor, out)
+        else:
+            self._evaluate_numpy(x_tensor, out)
+        
+        if self.penalty_weight:
+            self._fold_penalty(out)
+    
+    def _evaluate_numpy(self, x_tensor: np.ndarray, out: dict):
+        """Evaluate the population with batched NumPy operations."""
+        # Calculate SoC trajectories
+        soc_profiles = self._calculate_soc_profiles(x_tensor)
+        
+        # Site power profile (population x hours): masking and the sum over
+        # vehicles fused in one einsum, no masked power tensor
+        total_power = np.einsum('pvt,vt->pt', x_tensor, self._mask, out=self._total_power_buf)
         
         # Objectives
-        cost = self._calculate_cost(power_matrix)
+        cost = self._calculate_cost(total_power)
         dissatisfaction = self._calculate_dissatisfaction(soc_profiles)
-        peak_power = self._calculate_peak_power(power_matrix)
+        peak_power = self._calculate_peak_power(total_power)
         
         # Constraints
         soc_violation = self._calculate_soc_violation(soc_profiles)
-        power_violation = self._calculate_power_violation(power_matrix)
+        power_violation = self._calculate_power_violation(peak_power)
         
-        out["F"] = [cost, dissatisfaction, peak_power]
-        out["G"] = [soc_violation, power_violation]
+        out["F"] = np.column_stack([cost, dissatisfaction, peak_power])
+        out["G"] = np.column_stack([soc_violation, power_violation])
     
-    def _calculate_soc_profiles(self, power_matrix: np.ndarray) -> np.ndarray:
-        """Calculate SoC evolution for all vehicles."""
-        battery_capacities = self.scenario.get_battery_capacities()
-        soc_initial = self.scenario.get_initial_soc_vector()
+    def _evaluate_cupy(self, x_tensor: np.ndarray, out: dict):
+        """Evaluate the population on the GPU (one upload of X, one download of F and G)."""
+        if self._gpu is None:
+            self._gpu = {
+                name: cp.asarray(getattr(self, name))
+                for name in ('_mask', '_scaled_mask', '_soc_initial', '_soc_target', '_price_dt', '_row_idx', '_dep_idx')
+            }
+        gpu = self._gpu
         
-        # Energy per time step
-        energy_step = (power_matrix * settings.dt) / battery_capacities[:, np.newaxis]
+        x_gpu = cp.asarray(x_tensor, dtype=self.DTYPE)
         
-        # Cumulative SoC
-        soc_profiles = np.cumsum(energy_step, axis=1) + soc_initial[:, np.newaxis]
+        # Same formulas as _evaluate_numpy
+        total_power = cp.einsum('pvt,vt->pt', x_gpu, gpu['_mask'])
+        soc_profiles = cp.cumsum(x_gpu * gpu['_scaled_mask'], axis=2)
+        soc_profiles += gpu['_soc_initial'][:, None]
         
-        return soc_profiles
+        cost = total_power @ gpu['_price_dt']
+        final_socs = soc_profiles[:, gpu['_row_idx'], gpu['_dep_idx']]
+        dissatisfaction = cp.maximum(0, gpu['_soc_target'] - final_socs).sum(axis=1)
+        peak_power = cp.abs(total_power).max(axis=1)
+        soc_violation = cp.abs(soc_profiles - cp.clip(soc_profiles, 0.0, 1.0)).sum(axis=(1, 2))
+        power_violation = cp.maximum(0, peak_power - self._site_max_power)
+        
+        out["F"] = cp.asnumpy(cp.stack([cost, dissatisfaction, peak_power], axis=1)).astype(float)
+        out["G"] = cp.asnumpy(cp.stack([soc_violation, power_violation], axis=1)).astype(float)
+    
+    def _fold_penalty(self, out: dict):
+        """Replace the constraints by a weighted violation penalty on each objective."""
+        violation = out.pop("G").sum(axis=1)
+        out["F"] += self.penalty_weight * violation[:, np.newaxis]
     
-    def _calculate_cost(self, power_matrix: np.ndarray) -> float:
-        """Calculate total electricity cost."""
-        total_power = np.sum(power_matrix, axis=0)
-        cost = np.sum(total_power * self.scenario.price_profile * settings.dt)
-        return float(cost)
+    def _ensure_buffers(self, shape: tuple):
+        """(Re)allocate the scratch buffers when the population shape changes."""
+        if self._x_buf is not None and self._x_buf.shape == shape:
+            return
+        self._x_buf = np.empty(shape, dtype=self.DTYPE)
+        self._total_power_buf = np.empty((shape[0], shape[2]), dtype=self.DTYPE)
+        # The fused kernel works per vehicle row and needs no (pop x N x T) scratch
+        if not self.use_numba:
+            self._soc_buf = np.empty(shape, dtype=self.DTYPE)
     
-    def _calculate_dissatisfaction(self, soc_profiles: np.ndarray) -> float:
-        """Calculate dissatisfaction (unmet charging needs)."""
-        departure_times = self.scenario.get_departure_times()
-        target_socs = self.scenario.get_target_soc_vector()
+    def _evaluate_numba(self, x_tensor: np.ndarray, out: dict):
+        """Evaluate the population with the fused Numba kernel."""
+        pop_size = x_tensor.shape[0]
+        F = np.empty((pop_size, 3))
+        G = np.empty((pop_size, 2))
         
-        final_socs = np.array([
-            soc_profiles[i, min(int(t), self.scenario.time_horizon - 1)]
-            for i, t in enumerate(departure_times)
-        ])
+        kernels.evaluate_population(
+            x_tensor,
+            self._mask,
+            self._dt_over_cap,
+            self._soc_initial,
+            self._soc_target,
+            self._dep_idx,
+            self._price_dt,
+            self._site_max_power,
+            self._total_power_buf,
+            F,
+            G
+        )
+        
+        out["F"] = F
+        out["G"] = G
+    
+    def _calculate_soc_profiles(self, x_tensor: np.ndarray) -> np.ndarray:
+        """Calculate SoC evolution for all vehicles of every individual (in the SoC buffer)."""
+        # SoC increment per time step (masked power * dt / capacity)
+        soc_profiles = np.multiply(x_tensor, self._scaled_mask, out=self._soc_buf)
+        
+        # Cumulative SoC, accumulated in place
+        np.cumsum(soc_profiles, axis=2, out=soc_profiles)
+        soc_profiles += self._soc_initial[:, np.newaxis]
+        
+        return soc_profiles
+    
+    def _calculate_cost(self, total_power: np.ndarray) -> np.ndarray:
+        """Calculate total electricity cost per individual."""
+        # (pop x hours) @ (hours,) -> single GEMV instead of multiply + sum
+        return total_power @ self._price_dt
+    
+    def _calculate_dissatisfaction(self, soc_profiles: np.ndarray) -> np.ndarray:
+        """Calculate dissatisfaction (unmet charging needs) per individual."""
+        final_socs = soc_profiles[:, self._row_idx, self._dep_idx]
         
         # Penalize vehicles not reaching target
-        shortfall = np.maximum(0, target_socs - final_socs)
-        dissatisfaction = np.sum(shortfall)
+        shortfall = np.maximum(0, self._soc_target - final_socs)
+        dissatisfaction = np.sum(shortfall, axis=1)
         
-        return float(dissatisfaction)
+        return dissatisfaction
+    
+    def _calculate_peak_power(self, total_power: np.ndarray) -> np.ndarray:
+        """Calculate peak total power per individual."""
+        peak = np.max(np.abs(total_power), axis=1)
+        return peak
+    
+    def _calculate_soc_violation(self, soc_profiles: np.ndarray) -> np.ndarray:
+        """Calculate SoC constraint violation per individual."""
+        # Distance to the [0, 1] interval: one clip, one subtract, one abs-sum
+        soc_clipped = np.clip(soc_profiles, 0.0, 1.0)
+        return np.abs(soc_profiles - soc_clipped).sum(axis=(1, 2))
+    
+    def _calculate_power_violation(self, peak_power: np.ndarray) -> np.ndarray:
+        """Calculate site power constraint violation per individual."""
+        # max_t max(0, |P_t| - P_site) == max(0, peak - P_site)
+        return np.maximum(0, peak_power - self._site_max_power)
+
+
+class HeuristicSampling(Sampling):
+    """
+    Initial population seeded from the greedy heuristic schedule.
     
-    def _calculate_peak_power(self, power_matrix: np.ndarray) -> float:
-        """Calculate peak total power."""
-        total_power = np.sum(power_matrix, axis=0)
-        peak = np.max(np.abs(total_power))
-        return float(peak)
+    The first individual is the heuristic itself, the others are Gaussian
+    perturbations of it, clipped to the problem bounds.
+    """
     
-    def _calculate_soc_violation(self, soc_profiles: np.ndarray) -> float:
-        """Calculate SoC constraint violation."""
-        below_zero = np.sum(np.maximum(0, -soc_profiles))
-        above_one = np.sum(np.maximum(0, soc_profiles - 1.0))
-        return float(below_zero + above_one)
+    def __init__(self, noise: float = 0.1):
+        """
+        Args:
+            noise: Standard deviation of the perturbation, as a fraction of the bound range
+        """
+        super().__init__()
+        self.noise = noise
     
-    def _calculate_power_violation(self, power_matrix: np.ndarray) -> float:
-        """Calculate site power constraint violation."""
-        total_power = np.sum(power_matrix, axis=0)
-        violation = np.max(np.maximum(0, np.abs(total_power) - self.scenario.site_max_power))
-        return float(violation)
+    def _do(self, problem, n_samples, **kwargs):
+        base = problem.heuristic_schedule().reshape(-1)
+        scale = self.noise * (problem.xu - problem.xl)
+        
+        X = base + np.random.normal(size=(n_samples, problem.n_var)) * scale
+        X[0] = base
+        
+        return np.clip(X, problem.xl, problem.xu)
 
 
 class MODEOptimizerService(IOptimizer):
@@ -183,21 +404,39 @@ class MODEOptimizerService(IOptimizer):
         
         try:
             # Create problem
-            problem = EVChargingProblem(scenario)
+            problem = EVChargingProblem(
+                scenario,
+                penalty_weight=opt_config.get('constraint_penalty', 0.0),
+                device=opt_config.get('device', 'cpu')
+            )
+            
+            # Create algorithm (optionally warm-started from the heuristic schedule)
+            algorithm_kwargs = {}
+            if opt_config.get('warm_start', False):
+                algorithm_kwargs['sampling'] = HeuristicSampling()
             
-            # Create algorithm
             algorithm = MODE(
                 pop_size=opt_config['pop_size'],
                 variant=opt_config['variant'],
                 CR=opt_config['CR'],
-                F=opt_config['F']
+                F=opt_config['F'],
+                **algorithm_kwargs
             )
             
+            # Stop early once the front stops moving, n_gen remains the upper bound
+            if opt_config.get('adaptive_termination', False):
+                termination = DefaultMultiObjectiveTermination(
+                    n_max_gen=opt_config['n_gen'],
+                    n_max_evals=opt_config['n_gen'] * opt_config['pop_size']
+                )
+            else:
+                termination = ('n_gen', opt_config['n_gen'])
+            
             # Run optimization
             res = minimize(
                 problem,
                 algorithm,
-                ('n_gen', opt_config['n_gen']),
+                termination,
                 seed=1,
                 verbose=False
             )
@@ -207,32 +446,47 @@ class MODEOptimizerService(IOptimizer):
             # Check if solutions found
             if res.F is None or len(res.F) == 0:
                 raise OptimizationError("No valid solutions found")
-            
-            # Extract best solution (minimum cost)
-            if res.F.ndim > 1:
-                best_idx = np.argmin(res.F[:, 0])
-                best_objectives = res.F[best_idx]
-                best_schedule = res.X[best_idx]
+            # A single solution comes back 1-D: view everything as (solutions x ...)
+            X = np.atleast_2d(res.X)
+            if problem.penalty_weight:
+                # res.F includes the folded penalty: report the raw objectives
+                # and constraints of the returned schedules instead
+                raw = EVChargingProblem(scenario, device=problem.device)
+                front, G = raw.evaluate(X, return_values_of=["F", "G"])
             else:
-                best_objectives = res.F
-                best_schedule = res.X
+                front, G = np.atleast_2d(res.F), np.atleast_2d(res.G)
+            has_front = len(front) > 1
+            n_vehicles = len(scenario.vehicles)
+            horizon = scenario.time_horizon
+            
+            # Extract best solution (minimum cost, single O(n) scan)
+            best_idx = int(np.argmin(front[:, 0]))
+            best_objectives = front[best_idx]
+            best_schedule = X[best_idx]
+            soc_violation, power_violation = G[best_idx].tolist()
+            if soc_violation > 0 or power_violation > 0:
+                logger.warning(
+                    f"Best schedule violates the constraints - "
+                    f"SoC: {soc_violation:.4f}, site power: {power_violation:.2f}kW"
+                )
             
             # Reshape schedule
-            schedule = best_schedule.reshape((len(scenario.vehicles), scenario.time_horizon))
+            schedule = best_schedule.reshape((n_vehicles, horizon))
             
             # Create metrics
+            cost, dissatisfaction, peak_power = best_objectives[:3].tolist()
             metrics = OptimizationMetrics(
-                cost=float(best_objectives[0]),
-                dissatisfaction=float(best_objectives[1]),
-                peak_power=float(best_objectives[2])
+                cost=cost,
+                dissatisfaction=dissatisfaction,
+                peak_power=peak_power
             )
             
             # Calculate global metrics
             perf_metrics = {}
-            if res.F.ndim > 1:
+            if has_front:
                 try:
                     calculator = MetricsCalculator()
-                    perf_metrics = calculator.calculate_all(res.F)
+                    perf_metrics = calculator.calculate_all(front)
                 except Exception as e:
                     logger.warning(f"Could not calculate metrics: {e}")
 
@@ -240,17 +494,23 @@ class MODEOptimizerService(IOptimizer):
             result = OptimizationResult(
                 metrics=metrics,
                 charging_schedule=schedule,
-                n_vehicles=len(scenario.vehicles),
-                n_hours=scenario.time_horizon,
-                solutions_found=len(res.F) if res.F.ndim > 1 else 1,
+                n_vehicles=n_vehicles,
+                n_hours=horizon,
+                solutions_found=len(front),
                 execution_time=execution_time,
                 converged=True,
-                pareto_front=res.F if res.F.ndim > 1 else None,  # Save all Pareto solutions
+                pareto_front=front if has_front else None,  # Save all Pareto solutions
                 performance_metrics=perf_metrics,
                 metadata={
                     'algorithm': self.get_algorithm_name(),
                     'config': opt_config,
-                    'scenario_name': scenario.name
+                    'scenario_name': scenario.name,
+                    'constraint_penalty': problem.penalty_weight,
+                    'constraint_violation': {
+                        'soc': soc_violation,
+                        'site_power': power_violation
+                    },
+                    'feasible': soc_violation <= 0 and power_violation <= 0
                 }
             )
             
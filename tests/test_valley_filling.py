@@ -0,0 +1,113 @@
+"""
+Tests for the valley-filling water level computation and schedule scoring.
+"""
+import numpy as np
+import pytest
+
+from src.infrastructure.repositories.synthetic_generator import SyntheticDataGenerator
+from src.services.valley_filling_service import _score, _water_fill
+
+
+def _bisect_level(base: np.ndarray, demand: float, cap: np.ndarray, iterations: int = 200) -> float:
+    """Brute-force water level: bisection on sum(clip(L - base, 0, cap)) == demand."""
+    low, high = base.min(), (base + cap).max()
+    for _ in range(iterations):
+        level = (low + high) / 2
+        if np.clip(level - base, 0.0, cap).sum() < demand:
+            low = level
+        else:
+            high = level
+    return (low + high) / 2
+
+
+def _random_case(seed: int, n_slots: int = 12):
+    """Random load levels and caps, with a demand that fits in the caps."""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.0, 50.0, n_slots)
+    cap = rng.uniform(0.0, 7.0, n_slots)
+    demand = rng.uniform(0.05, 0.95) * cap.sum()
+    return base, demand, cap
+
+
+CASES = [_random_case(seed) for seed in range(20)] + [
+    # Ties in the load levels
+    (np.array([10.0, 10.0, 10.0, 20.0]), 9.0, np.array([7.0, 7.0, 7.0, 7.0])),
+    # Slots without capacity
+    (np.array([0.0, 5.0, 1.0, 3.0]), 4.0, np.array([0.0, 7.0, 2.0, 0.0])),
+    # Demand filling a single slot
+    (np.array([0.0, 100.0]), 3.0, np.array([7.0, 7.0])),
+]
+
+
+@pytest.mark.parametrize("base, demand, cap", CASES)
+def test_water_fill_places_the_whole_demand(base, demand, cap):
+    power = _water_fill(base, demand, cap)
+    assert power.sum() == pytest.approx(demand, rel=1e-9)
+
+
+@pytest.mark.parametrize("base, demand, cap", CASES)
+def test_water_fill_respects_slot_caps(base, demand, cap):
+    power = _water_fill(base, demand, cap)
+    assert np.all(power >= 0.0)
+    assert np.all(power <= cap + 1e-12)
+
+
+@pytest.mark.parametrize("base, demand, cap", CASES)
+def test_water_fill_matches_bisection_level(base, demand, cap):
+    power = _water_fill(base, demand, cap)
+    level = _bisect_level(base, demand, cap)
+
+    np.testing.assert_allclose(power, np.clip(level - base, 0.0, cap), atol=1e-9)
+
+    # Partially filled slots all end at the same level
+    partial = (power > 1e-9) & (power < cap - 1e-9)
+    np.testing.assert_allclose(base[partial] + power[partial], level, atol=1e-9)
+
+
+@pytest.mark.parametrize("extra", [0.0, 1.0, 100.0])
+def test_water_fill_saturates_when_demand_exceeds_caps(extra):
+    base = np.array([3.0, 0.0, 8.0, 1.0])
+    cap = np.array([7.0, 2.0, 0.0, 5.0])
+
+    power = _water_fill(base, cap.sum() + extra, cap)
+
+    np.testing.assert_array_equal(power, cap)
+    assert power is not cap
+
+
+def test_water_fill_without_demand_places_nothing():
+    base = np.array([3.0, 0.0, 8.0])
+    cap = np.array([7.0, 2.0, 1.0])
+
+    np.testing.assert_array_equal(_water_fill(base, 0.0, cap), np.zeros(3))
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_water_fill_near_capacity_stays_finite(seed):
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.0, 50.0, 12)
+    cap = rng.uniform(0.0, 7.0, 12)
+    demand = np.nextafter(cap.sum(), 0.0)
+
+    power = _water_fill(base, demand, cap)
+
+    assert np.all(np.isfinite(power))
+    assert np.all(power >= 0.0)
+    assert np.all(power <= cap + 1e-12)
+    assert power.sum() == pytest.approx(demand, rel=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_score_matches_the_mode_problem(seed):
+    from src.services.optimization_service import EVChargingProblem
+
+    scenario = SyntheticDataGenerator().generate_scenario(
+        n_vehicles=20, time_horizon=24, site_max_power=60.0, seed=seed
+    )
+    schedule = np.random.default_rng(seed).uniform(-6.0, 3.0, (20, 24))
+
+    F = EVChargingProblem(scenario, use_numba=False).evaluate(
+        schedule.reshape(1, -1), return_values_of=["F"]
+    )
+
+    np.testing.assert_allclose(_score(scenario, schedule), F.reshape(-1), rtol=1e-4, atol=1e-4)